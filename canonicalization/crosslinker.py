@@ -255,6 +255,36 @@ def _alias_pattern(celex: str) -> str:
     return "|".join(aliases)
 
 
+# Per-CELEX compiled (of-form, prefix-form) usage patterns, built on first use.
+# The crosslinker narrows one document-level edge at a time, so without this
+# every edge re-read the catalogue and recompiled both patterns.
+_NARROW_PATTERNS: dict[str, tuple[re.Pattern[str], re.Pattern[str]] | None] = {}
+
+
+def _narrow_patterns(celex: str) -> tuple[re.Pattern[str], re.Pattern[str]] | None:
+    """Return the cached narrowing patterns for *celex* (None = no aliases)."""
+    if celex in _NARROW_PATTERNS:
+        return _NARROW_PATTERNS[celex]
+    alias = _alias_pattern(celex)
+    patterns = None
+    if alias:
+        patterns = (
+            # "Article 6(1) of Regulation (EU) 2024/1689" / "Annex VIII of the MDR"
+            re.compile(
+                rf"({_NARROW_PROV_FRAG})\s+(?:of|to|under)\s+(?:the\s+)?"
+                rf"(?:Regulation\s+\(EU\)\s+(?:No\s+)?)?(?:{alias})\b",
+                re.IGNORECASE,
+            ),
+            # "MDR Article 120" / "AI Act Annex III" (optionally comma-separated)
+            re.compile(
+                rf"(?:{alias})\s*,?\s+({_NARROW_PROV_FRAG})",
+                re.IGNORECASE,
+            ),
+        )
+    _NARROW_PATTERNS[celex] = patterns
+    return patterns
+
+
 def narrow_document_ref(source_text: str, target_celex: str) -> list[dict[str, str]]:
     """Extract provision parts explicitly bound to *target_celex* in the text.
 
@@ -265,26 +295,13 @@ def narrow_document_ref(source_text: str, target_celex: str) -> list[dict[str, s
     """
     if not source_text:
         return []
-    alias = _alias_pattern(target_celex)
-    if not alias:
+    patterns = _narrow_patterns(target_celex)
+    if patterns is None:
         return []
 
     fragments: list[str] = []
-    # "Article 6(1) of Regulation (EU) 2024/1689" / "Annex VIII of the MDR"
-    for m in re.finditer(
-        rf"({_NARROW_PROV_FRAG})\s+(?:of|to|under)\s+(?:the\s+)?"
-        rf"(?:Regulation\s+\(EU\)\s+(?:No\s+)?)?(?:{alias})\b",
-        source_text,
-        re.IGNORECASE,
-    ):
-        fragments.append(m.group(1))
-    # "MDR Article 120" / "AI Act Annex III" (optionally comma-separated)
-    for m in re.finditer(
-        rf"(?:{alias})\s*,?\s+({_NARROW_PROV_FRAG})",
-        source_text,
-        re.IGNORECASE,
-    ):
-        fragments.append(m.group(1))
+    for pattern in patterns:
+        fragments.extend(m.group(1) for m in pattern.finditer(source_text))
 
     parts_list: list[dict[str, str]] = []
     seen_ids: set[str] = set()
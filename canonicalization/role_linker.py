@@ -29,6 +29,7 @@ from domain.ontology.actor_roles import (
     EXACT_LEGAL_ROLE_SPECS,
     ROLE_SOURCE_TYPE_DEFINED_TERM,
     STANDALONE_ROLE_SPECS,
+    _build_phrase_scanner,
     normalize_role_term,
 )
 from infrastructure.graphdb.neo4j.loader import _normalize_neo4j_uri
@@ -37,6 +38,13 @@ logger = logging.getLogger(__name__)
 
 _BATCH = 500
 _MODAL_RE = re.compile(r"\b(shall(?:\s+not)?|must(?:\s+not)?|is\s+required\s+to|are\s+required\s+to)\b", re.I)
+# Literal "shall not" / "must not" anywhere in the sentence (no word boundaries,
+# matching the original lower-cased substring test) marks a prohibition.
+_PROHIBITION_CUE_RE = re.compile(r"shall not|must not", re.I)
+# Leading paragraph/point enumeration marker: "1.", "(1)", "(a)".
+_LEADING_MARKER_RE = re.compile(r"^(?:\d{1,3}\.|\(\d{1,3}\)|\([a-z]{1,2}\))\s+")
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.;])\s+")
+_MEANS_RE = re.compile(r"\bmeans\b", re.I)
 
 
 def _role_node_id(term_normalized: str, celex: str) -> str:
@@ -88,19 +96,40 @@ def _build_role_regex(term: str) -> re.Pattern:
     return re.compile(r"\b(?:" + "|".join(escaped) + r")\b", re.I)
 
 
+def _build_role_scanner(roles: list[dict[str, Any]]):
+    """Return ``scan(text) -> set[int]`` of indices into *roles* named in *text*.
+
+    Equivalent to running every role's :func:`_build_role_regex` over *text*.
+    """
+    variant_roles: dict[str, set[int]] = {}
+    for idx, role in enumerate(roles):
+        term = role["term"].lower()
+        for variant in {term, _pluralize_last_word(term)}:
+            variant_roles.setdefault(variant, set()).add(idx)
+    scan_variants = _build_phrase_scanner(variant_roles, re.I)
+
+    def scan(text: str) -> set[int]:
+        found: set[int] = set()
+        for variant in scan_variants(text):
+            found.update(variant_roles[variant])
+        return found
+
+    return scan
+
+
 def _first_sentence(text: str) -> str:
     normalized = text.replace("\xa0", " ").strip()
     # Skip a leading paragraph/point enumeration marker ("1.", "(1)", "(a)"):
     # flattened article bodies start with the first paragraph's number, so the
     # naive [.;] split returned the literal "1." as the whole first sentence
     # and the actor-role check could never fire for numbered articles.
-    normalized = re.sub(r"^(?:\d{1,3}\.|\(\d{1,3}\)|\([a-z]{1,2}\))\s+", "", normalized)
-    match = re.split(r"(?<=[.;])\s+", normalized, maxsplit=1)
+    normalized = _LEADING_MARKER_RE.sub("", normalized)
+    match = _SENTENCE_BREAK_RE.split(normalized, maxsplit=1)
     return match[0][:400] if match else normalized[:400]
 
 
 def _definition_body(text: str) -> str:
-    parts = re.split(r"\bmeans\b", text or "", maxsplit=1, flags=re.I)
+    parts = _MEANS_RE.split(text or "", maxsplit=1)
     if len(parts) == 2:
         return parts[1].strip()
     return (text or "").strip()
@@ -123,6 +152,11 @@ def _detect_composite_role_ids(defined_terms: list[dict[str, Any]]) -> set[str]:
             if row.get("category") == "actor"
         }
 
+        # Definition clauses are fixed while the promotable set grows, so each
+        # clause is scanned once for every term of this regulation.
+        scan_terms = _build_phrase_scanner(row["term"].lower() for row in terms)
+        clause_terms: dict[str, tuple[str, set[str]]] = {}
+
         changed = True
         while changed:
             changed = False
@@ -151,15 +185,18 @@ def _detect_composite_role_ids(defined_terms: list[dict[str, Any]]) -> set[str]:
                     composite_ids.add(row["defined_term_id"])
                     changed = True
                     continue
-                clause = re.split(
-                    r"[.;]",
-                    _definition_body(row.get("definition_text") or "").lower(),
-                    maxsplit=1,
-                )[0]
-                matched_terms: list[str] = []
-                for actor in promotable_terms:
-                    if re.search(r"\b" + re.escape(actor["term"].lower()) + r"\b", clause):
-                        matched_terms.append(actor["term"].lower())
+                if row["defined_term_id"] not in clause_terms:
+                    clause = re.split(
+                        r"[.;]",
+                        _definition_body(row.get("definition_text") or "").lower(),
+                        maxsplit=1,
+                    )[0]
+                    clause_terms[row["defined_term_id"]] = (clause, scan_terms(clause))
+                clause, found_terms = clause_terms[row["defined_term_id"]]
+                matched_terms = [
+                    actor["term"].lower() for actor in promotable_terms
+                    if actor["term"].lower() in found_terms
+                ]
                 if _is_composite_definition(clause, matched_terms):
                     promotable_ids.add(row["defined_term_id"])
                     composite_ids.add(row["defined_term_id"])
@@ -314,6 +351,7 @@ def _build_includes_edges(actor_terms: list[dict[str, Any]]) -> list[dict[str, s
             }
             for role in roles
         ]
+        scan_terms = _build_phrase_scanner(c["term_lower"] for c in candidates)
         for role in candidates:
             if role.get("category") == "actor":
                 continue
@@ -344,12 +382,11 @@ def _build_includes_edges(actor_terms: list[dict[str, Any]]) -> list[dict[str, s
                     })
                 continue
             clause = re.split(r"[.;]", _definition_body(role["definition_text"]).lower(), maxsplit=1)[0]
-            matched_terms: list[str] = []
-            for other in candidates:
-                if other["role_id"] == role["role_id"]:
-                    continue
-                if re.search(r"\b" + re.escape(other["term_lower"]) + r"\b", clause):
-                    matched_terms.append(other["term_lower"])
+            found_terms = scan_terms(clause)
+            matched_terms = [
+                other["term_lower"] for other in candidates
+                if other["role_id"] != role["role_id"] and other["term_lower"] in found_terms
+            ]
             if not _is_composite_definition(clause, matched_terms):
                 continue
             for other in candidates:
@@ -375,7 +412,7 @@ def _detect_modality(text: str, title: str | None) -> str | None:
     title_lower = (title or "").lower()
     if "obligation" in title_lower:
         return "obligation"
-    if "shall not" in text.lower() or "must not" in text.lower():
+    if _PROHIBITION_CUE_RE.search(text):
         return "prohibition"
     if _MODAL_RE.search(text):
         return "obligation"
@@ -414,6 +451,9 @@ def _build_obligation_edges(
         row["role_id"] = _role_node_id(row["term_normalized"], row["celex"])
         row["term_regex"] = _build_role_regex(row["term"])
         by_celex.setdefault(row["celex"], []).append(row)
+    # One scanner per regulation finds every role mentioned in a title or
+    # sentence in a single pass, instead of one regex search per role.
+    scanners = {celex: _build_role_scanner(rows) for celex, rows in by_celex.items()}
 
     edges: list[dict[str, str]] = []
     seen: set[tuple[str, str]] = set()
@@ -421,13 +461,18 @@ def _build_obligation_edges(
         candidates = by_celex.get(prov["celex"], [])
         if not candidates:
             continue
+        scan = scanners[prov["celex"]]
         title = prov.get("title") or ""
         sentence = _first_sentence(strip_context_prefix(prov.get("text")))
-        modality = _detect_modality(sentence, title)
         title_lower = title.lower()
-        for role in candidates:
-            role_in_title = bool(title and role["term_regex"].search(title_lower))
-            role_in_sentence = bool(role["term_regex"].search(sentence))
+        in_title = scan(title_lower) if title else set()
+        in_sentence = scan(sentence)
+        if not in_title and not in_sentence:
+            continue
+        modality = _detect_modality(sentence, title)
+        for idx, role in enumerate(candidates):
+            role_in_title = idx in in_title
+            role_in_sentence = idx in in_sentence
             if not role_in_title and not role_in_sentence:
                 continue
             # A provision whose title *is* this role's name is its duty article
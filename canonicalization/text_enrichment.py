@@ -95,6 +95,8 @@ def enrich_text_for_analysis(provisions: List[Dict[str, Any]]) -> int:
     # ``text_for_analysis`` = prefix + body.
     # ------------------------------------------------------------------
     enriched = 0
+    # Siblings share one ancestry; render each distinct path only once.
+    ancestry_cache: Dict[tuple, str] = {}
     for prov in provisions:
         kind = prov.get("kind", "")
         if kind in _SKIP_KINDS:
@@ -129,7 +131,7 @@ def enrich_text_for_analysis(provisions: List[Dict[str, Any]]) -> int:
             else:
                 body = cut
 
-        prefix = _build_context_prefix(prov, by_id)
+        prefix = _build_context_prefix(prov, by_id, ancestry_cache)
         if prefix:
             prov["text_for_analysis"] = prefix + _CTX_SEP + body
             if capped:
@@ -188,55 +190,72 @@ def _flatten_all(
 ) -> None:
     """Compute flattened body text for every provision via post-order DFS."""
     # We process provisions from leaves upward.  The ``children`` list
-    # gives the tree structure.
+    # gives the tree structure.  An explicit stack replaces recursion so
+    # deep annex trees cannot hit the interpreter recursion limit; each
+    # entry is ``(pid, expanded)`` and a node is finalised once all of its
+    # children have been popped.
 
     # Track visited to avoid re-computation.
     visited: set = set()
+    # Local aliases for the hot loop.
+    by_id_get = by_id.get
+    out_get = out.get
 
-    def _flatten(pid: str) -> str:
-        if pid in visited:
-            return out.get(pid, "")
-        visited.add(pid)
-
-        prov = by_id.get(pid)
-        if prov is None:
-            return ""
-
-        children_ids: List[str] = prov.get("children", [])
-        own_text = (prov.get("text") or "").strip()
-        kind = prov.get("kind", "")
-        title = (prov.get("title") or "").strip()
-
-        # Determine if own_text is meaningful body vs. heading-only.
-        has_body = bool(own_text) and own_text != title
-
-        if not children_ids:
-            # Leaf node — use own text directly.
-            out[pid] = own_text
-            return own_text
-
-        # Non-leaf — recurse into children.
-        child_texts = [_flatten(cid) for cid in children_ids]
-        joined_children = _CHILD_SEP.join(t for t in child_texts if t)
-
-        if has_body:
-            # Node has both its own body text and children.
-            # Prepend own text (e.g. introductory paragraph stem).
-            flattened = own_text + _CHILD_SEP + joined_children if joined_children else own_text
-        else:
-            # Node text is empty or heading-only; body comes from children.
-            flattened = joined_children
-
-        out[pid] = flattened
-        return flattened
+    for root in provisions:
+        if root["id"] in visited:
+            continue
+        stack: List[tuple] = [(root["id"], False)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            pid, expanded = pop()
+            prov = by_id_get(pid)
+
+            if not expanded:
+                if pid in visited:
+                    continue
+                visited.add(pid)
+                if prov is None:
+                    continue
+
+                children_ids: List[str] = prov.get("children", [])
+                if not children_ids:
+                    # Leaf node — use own text directly.
+                    out[pid] = (prov.get("text") or "").strip()
+                    continue
+
+                # Non-leaf — revisit after the children, which are pushed
+                # in reverse so they are flattened in document order.
+                push((pid, True))
+                for cid in reversed(children_ids):
+                    push((cid, False))
+                continue
+
+            own_text = (prov.get("text") or "").strip()
+            title = (prov.get("title") or "").strip()
+
+            # Determine if own_text is meaningful body vs. heading-only.
+            has_body = bool(own_text) and own_text != title
+
+            joined_children = _CHILD_SEP.join(
+                t for t in (out_get(cid, "") for cid in prov["children"]) if t
+            )
+
+            if has_body:
+                # Node has both its own body text and children.
+                # Prepend own text (e.g. introductory paragraph stem).
+                flattened = own_text + _CHILD_SEP + joined_children if joined_children else own_text
+            else:
+                # Node text is empty or heading-only; body comes from children.
+                flattened = joined_children
 
-    for prov in provisions:
-        _flatten(prov["id"])
+            out[pid] = flattened
 
 
 def _build_context_prefix(
     prov: Dict[str, Any],
     by_id: Dict[str, Dict[str, Any]],
+    ancestry_cache: Optional[Dict[tuple, str]] = None,
 ) -> str:
     """Build a human-readable ancestry prefix from the provision's path.
 
@@ -248,24 +267,30 @@ def _build_context_prefix(
 
     Only ancestors with heading-like kinds contribute segments.
     The provision itself is included if it is a heading kind.
-    """
-    path_ids: List[str] = prov.get("path", []) or []
-    segments: List[str] = []
 
-    for anc_id in path_ids:
-        anc = by_id.get(anc_id)
-        if anc is None:
-            continue
-        seg = _heading_segment(anc)
-        if seg:
-            segments.append(seg)
+    *ancestry_cache*, when given, maps a path (as a tuple) to its rendered
+    ancestor segments so a batch renders each shared ancestry once.
+    """
+    path_key = tuple(prov.get("path", []) or ())
+    ancestry = ancestry_cache.get(path_key) if ancestry_cache is not None else None
+    if ancestry is None:
+        segments: List[str] = []
+        for anc_id in path_key:
+            anc = by_id.get(anc_id)
+            if anc is None:
+                continue
+            seg = _heading_segment(anc)
+            if seg:
+                segments.append(seg)
+        ancestry = _PATH_SEP.join(segments)
+        if ancestry_cache is not None:
+            ancestry_cache[path_key] = ancestry
 
     # Include self if it's a heading kind (e.g. article, annex_section).
     own_seg = _heading_segment(prov)
-    if own_seg:
-        segments.append(own_seg)
-
-    return _PATH_SEP.join(segments)
+    if not own_seg:
+        return ancestry
+    return ancestry + _PATH_SEP + own_seg if ancestry else own_seg
 
 
 def _heading_segment(prov: Dict[str, Any]) -> Optional[str]:
@@ -394,6 +394,55 @@ _ENTITY_CONTEXT_PHRASES: tuple[str, ...] = (
     "healthcare provider",
 )
 
+# Both phrase sets are fixed at import, so their word-boundary regexes are
+# compiled once here rather than rebuilt per phrase on every question.
+_ENTITY_CONTEXT_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(p) for p in _ENTITY_CONTEXT_PHRASES) + r")\b"
+)
+
+
+def _build_phrase_scanner(phrases, flags: int = 0):
+    r"""Return ``scan(text) -> set[str]`` of *phrases* occurring as whole words.
+
+    Equivalent to ``re.search(r"\b" + re.escape(phrase) + r"\b", text, flags)``
+    for every phrase, but in one pass: a zero-width lookahead is tried at each
+    word boundary so overlapping mentions at different offsets are all
+    reported. At a single offset only the longest phrase is reported, so
+    shorter phrases that are a whole-word prefix of it are implied.
+    """
+    ordered = tuple(sorted(set(phrases), key=len, reverse=True))
+    if not ordered:
+        return lambda text: set()
+    scan_re = re.compile(
+        r"\b(?=(?:" + "|".join(rf"({re.escape(p)})\b" for p in ordered) + "))",
+        flags,
+    )
+    implied = {
+        phrase: tuple(
+            shorter for shorter in ordered
+            if shorter != phrase and re.match(re.escape(shorter) + r"\b", phrase)
+        )
+        for phrase in ordered
+    }
+
+    def scan(text: str) -> set[str]:
+        found: set[str] = set()
+        for m in scan_re.finditer(text):
+            phrase = ordered[m.lastindex - 1]
+            found.add(phrase)
+            found.update(implied[phrase])
+        return found
+
+    return scan
+
+
+# Longest-first: the order in which detected role specs are emitted.
+_SYNONYM_PHRASES: tuple[str, ...] = tuple(sorted(ENTITY_SYNONYMS, key=len, reverse=True))
+
+# Every ENTITY_SYNONYMS phrase occurring in a text as a whole phrase, found in
+# one scan ("product manufacturer" and the "manufacturer" inside it).
+_matched_synonym_phrases = _build_phrase_scanner(_SYNONYM_PHRASES)
+
 _PROVIDER_ACTION_RE = re.compile(
     r"\b(develop(?:s|ed|ing)?|build(?:s|ing)?|train(?:s|ed|ing)?|"
     r"put(?:s|ting)?\s+(?:an?\s+)?(?:ai\s+system\s+)?into\s+service|"
@@ -407,11 +456,6 @@ _MANUFACTURER_ACTION_RE = re.compile(
 )
 
 
-def _contains_phrase(text: str, phrase: str) -> bool:
-    """Return whether *phrase* appears in *text* as a whole phrase."""
-    return bool(re.search(r"\b" + re.escape(phrase) + r"\b", text))
-
-
 def detect_role_specs(
     question: str,
     *,
@@ -433,13 +477,14 @@ def detect_role_specs(
             seen.add(pair)
             detected.append(pair)
 
-    for phrase, specs in sorted(ENTITY_SYNONYMS.items(), key=lambda item: len(item[0]), reverse=True):
-        if not re.search(r"\b" + re.escape(phrase) + r"\b", q_lower):
+    matched = _matched_synonym_phrases(q_lower)
+    for phrase in _SYNONYM_PHRASES:
+        if phrase not in matched:
             continue
-        for term, celex in specs:
+        for term, celex in ENTITY_SYNONYMS[phrase]:
             add(term, celex)
 
-    has_entity_context = any(_contains_phrase(q_lower, phrase) for phrase in _ENTITY_CONTEXT_PHRASES)
+    has_entity_context = _ENTITY_CONTEXT_RE.search(q_lower) is not None
     if has_entity_context and _PROVIDER_ACTION_RE.search(q_lower):
         add("provider", "32024R1689")
     if has_entity_context and _MANUFACTURER_ACTION_RE.search(q_lower):
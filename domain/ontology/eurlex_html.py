@@ -37,7 +37,7 @@ CHAPTER_ID_RE = re.compile(r"^cpt_([IVXLCDM]+)$")
 SECTION_ID_RE = re.compile(r"^cpt_([IVXLCDM]+)\.sct_(\d+)$")
 ARTICLE_ID_RE = re.compile(r"^art_(\d+[a-z]?)$")
 PARAGRAPH_ID_RE = re.compile(r"^(\d{3}[a-z]?)\.(\d{3}[a-z]?)$")
-ANNEX_ID_RE = re.compile(r"^anx_[A-Za-z0-9]+$")
+ANNEX_ID_RE = re.compile(r"^anx_([A-Za-z0-9]+)$")
 
 
 # ── CSS class names (OJ / ELI typography) ────────────────────────────────────
@@ -20,7 +20,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Callable
+from typing import Callable, Iterable
 
 # ---------------------------------------------------------------------------
 # Closed taxonomy of legal roles
@@ -115,10 +115,47 @@ _ACTOR_SUBJECTS: tuple[str, ...] = (
     "sponsor", "sponsors",
 )
 
+
+def _emit_trie(node: dict) -> str:
+    """Compile a character trie into a regex alternation.
+
+    Every key is one literal character except ``None``, which lists the
+    regex tails ending at that node; ``""`` marks a bare end of word and
+    makes everything below the node optional.
+    """
+    tails = node.get(None, [])
+    children = sorted((ch, child) for ch, child in node.items() if ch is not None)
+    alts = [re.escape(ch) + _emit_trie(child) for ch, child in children]
+    alts += [f"(?:{t})" if "|" in t else t for t in tails if t]
+    optional = "" in tails
+    if not alts:
+        return ""
+    if len(alts) == 1 and not optional:
+        return alts[0]
+    group = "(?:" + "|".join(alts) + ")"
+    return group + "?" if optional else group
+
+
+def _trie_alternation(words: Iterable[str]) -> str:
+    """Return a regex alternation matching exactly ``words``, grouped by shared
+    prefix (``provider|providers`` -> ``provider(?:s)?``).
+
+    Singular/plural pairs and subjects sharing a leading word ("processor",
+    "product manufacturer", …) are then walked once per position instead of
+    once per listed literal.  Callers compiling
+    with ``re.IGNORECASE`` should pass lower-cased words.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[None] = [""]
+    return _emit_trie(trie)
+
+
 _ACTOR_SUBJECT_RE = re.compile(
-    r"\b(?:" + "|".join(
-        re.escape(a) for a in sorted(_ACTOR_SUBJECTS, key=len, reverse=True)
-    ) + r")\b",
+    r"\b(?:" + _trie_alternation({a.lower() for a in _ACTOR_SUBJECTS}) + r")\b",
     re.IGNORECASE,
 )
 
@@ -231,6 +268,11 @@ class RoleAssignment:
 # Helpers for definitions-article membership (works on provision id alone)
 # ---------------------------------------------------------------------------
 
+# Provision-id tails after the ``{celex}_`` prefix (see below).
+_ID_ARTICLE_RE = re.compile(r"art_(\d+)")
+_ID_PARAGRAPH_RE = re.compile(r"(\d{3})\.\d{3}")
+
+
 def _provision_article_number(provision_id: str, celex: str) -> str | None:
     """Extract the article number from a provision id, if it has one.
 
@@ -242,11 +284,11 @@ def _provision_article_number(provision_id: str, celex: str) -> str | None:
         return None
     rest = provision_id[len(celex) + 1:]
 
-    m = re.match(r"^art_(\d+)", rest)
+    m = _ID_ARTICLE_RE.match(rest)
     if m:
         return m.group(1)
 
-    m = re.match(r"^(\d{3})\.\d{3}", rest)
+    m = _ID_PARAGRAPH_RE.match(rest)
     if m:
         return str(int(m.group(1)))  # strip zero padding
 
@@ -258,7 +300,10 @@ def _is_in_definitions_article(provision_id: str, celex: str) -> bool:
     def_id = DEFINITIONS_ARTICLE_IDS.get(celex)
     if not def_id:
         return False
-    m = re.match(rf"^{re.escape(celex)}_art_(\d+)$", def_id)
+    prefix = f"{celex}_"
+    if not def_id.startswith(prefix):
+        return False
+    m = _ID_ARTICLE_RE.fullmatch(def_id, len(prefix))
     if not m:
         return False
     return _provision_article_number(provision_id, celex) == m.group(1)
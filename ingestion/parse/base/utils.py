@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import json
+from typing import Any, Dict, List, Optional
+
+# Prefer orjson when available (C encoder, several times faster on multi-MB
+# parsed.json payloads); the stdlib encoder keeps the parsers usable without
+# it.  Both produce the same 2-space-indented UTF-8 output.
+try:
+	import orjson  # type: ignore
+except ImportError:
+	orjson = None
 
 
 class ParserContext:
@@ -10,17 +19,62 @@ class ParserContext:
 		self.provisions: List[Dict] = []
 		self.relations: List[Dict] = []
 		self.nodes: Dict[str, Dict] = {}
+		# "{celex}_" prefix of every node id, built once per document
+		self._id_prefix = f"{celex}_"
+		# node id → the html_id it was made from (the id minus "{celex}_")
+		self._html_ids: Dict[str, str] = {}
+		# parent id → the path its children get, built once per parent
+		self._child_paths: Dict[str, List[str]] = {}
+		# div id → first div with that id, indexed on the first find_div call
+		self._divs_by_id: Optional[Dict[str, Any]] = None
 
 	def child_path(self, parent: Optional[Dict]) -> List[str]:
+		"""Return the ``path`` of a node made under *parent*.
+
+		Siblings share one list object, so node paths are read-only:
+		replace a node's ``path`` rather than mutating it in place.
+		"""
 		if not parent:
 			return []
-		return parent.get("path", []) + [parent["id"]]
+		pid = parent["id"]
+		path = self._child_paths.get(pid)
+		if path is None:
+			path = self._child_paths[pid] = parent.get("path", []) + [pid]
+		return path
+
+	def find_div(self, soup, html_id: str):
+		"""Return the first ``<div id=html_id>`` in *soup*, or None.
+
+		Same result as ``soup.find("div", id=html_id)``, but the first call
+		indexes every div id in one walk, so the parsers' many lookups are
+		dict hits rather than full-tree searches.  A context parses a single
+		document, so *soup* is the same on every call.
+		"""
+		if self._divs_by_id is None:
+			divs_by_id = self._divs_by_id = {}
+			for el in soup.descendants:
+				if el.name == "div":
+					div_id = el.get("id")
+					if div_id is not None:
+						divs_by_id.setdefault(div_id, el)
+		return self._divs_by_id.get(html_id)
+
+	def html_id_of(self, node: Dict) -> str:
+		"""Return *node*'s id without the ``{celex}_`` prefix."""
+		html_id = self._html_ids.get(node["id"])
+		if html_id is None:
+			html_id = node["id"].split(self._id_prefix, 1)[-1]
+			self._html_ids[node["id"]] = html_id
+		return html_id
 
 	def add_node(self, node: Dict, parent_id: Optional[str]) -> Dict:
 		self.provisions.append(node)
 		self.nodes[node["id"]] = node
-		if parent_id and parent_id in self.nodes:
-			self.nodes[parent_id]["children"].append(node["id"])
+		if parent_id:
+			# One hash lookup: .get instead of an ``in`` test plus indexing.
+			parent = self.nodes.get(parent_id)
+			if parent is not None:
+				parent["children"].append(node["id"])
 		return node
 
 	def make_node(
@@ -33,7 +87,8 @@ class ParserContext:
 		number: Optional[str] = None,
 	) -> Dict:
 		parent_id = parent["id"] if parent else None
-		node_id = f"{self.celex}_{html_id}"
+		node_id = self._id_prefix + html_id
+		self._html_ids[node_id] = html_id
 		node: Dict = {
 			"id": node_id,
 			"kind": kind,
@@ -49,3 +104,32 @@ class ParserContext:
 		if number is not None:
 			node["number"] = number
 		return self.add_node(node, parent_id)
+
+
+def dumps_indented(value: Any) -> bytes:
+	"""Serialise *value* as 2-space-indented UTF-8 JSON."""
+	if orjson is not None:
+		return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+	return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def text_outside_tables(root) -> str:
+	"""Text of ``root``, skipping any strings inside <table>s nested in it.
+
+	``root`` may itself be a table or table cell (a point's own text without
+	its sub-item tables) or a paragraph/article div.  Walks the element's own
+	strings in place rather than copying and re-parsing the subtree just to
+	drop the tables.
+	"""
+	if root.find("table") is None:
+		return root.get_text(" ", strip=True)
+	parts: List[str] = []
+	for s in root.strings:
+		parent = s.parent
+		while parent is not root and parent.name != "table":
+			parent = parent.parent
+		if parent is root:
+			s = s.strip()
+			if s:
+				parts.append(s)
+	return " ".join(parts)
@@ -7,19 +7,18 @@ writes ``parsed.json`` into the target directory. This keeps
 """
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
 from domain.legislation_catalog import LEGISLATION
 from canonicalization.text_enrichment import enrich_text_for_analysis
 from .base.registry import PARSER_REGISTRY
+from .base.utils import dumps_indented
 from .normalizer import normalize_consolidated_html
 from .semantic_layer.definitions import extract_defined_terms
 
-
 def _supplement_preamble(
     provisions: List[Dict[str, Any]],
     relations: List[Dict[str, Any]],
@@ -111,6 +110,33 @@ def _stamp_regulation_provenance(provisions: List[Dict[str, Any]]) -> None:
         provision["source_type"] = "regulation"
 
 
+def _write_json(out_file: Path, payload: Dict[str, Any]) -> None:
+    """Write *payload* as indented UTF-8 JSON, via orjson when installed.
+
+    Top-level lists (provisions, relations, defined terms) are streamed one
+    element at a time, so the serialised document is never held in memory
+    as a whole.  The bytes match a single ``json.dump(..., indent=2)``:
+    encoded strings never contain a raw newline, so re-indenting an element
+    is a plain newline substitution.
+    """
+    with out_file.open("wb") as fh:
+        write = fh.write
+        write(b"{")
+        for n, (key, value) in enumerate(payload.items()):
+            write(b",\n  " if n else b"\n  ")
+            write(dumps_indented(key))
+            write(b": ")
+            if isinstance(value, list) and value:
+                write(b"[")
+                for m, item in enumerate(value):
+                    write(b",\n    " if m else b"\n    ")
+                    write(dumps_indented(item).replace(b"\n", b"\n    "))
+                write(b"\n  ]")
+            else:
+                write(dumps_indented(value).replace(b"\n", b"\n  "))
+        write(b"\n}" if payload else b"}")
+
+
 def parse_document(html_file: Path, lang: str, celex: str, out_dir: Path) -> Path:
     """Dispatch to the appropriate regulation parser and write JSON output.
 
@@ -130,7 +156,9 @@ def parse_document(html_file: Path, lang: str, celex: str, out_dir: Path) -> Pat
     # Read HTML content and normalize if consolidated
     html_content = Path(html_file).read_text(encoding="utf-8")
     html_content = normalize_consolidated_html(html_content)
-    regulation_id = LEGISLATION.get(celex, {}).get("name", celex)
+    # One catalogue lookup serves the parser argument and the output header.
+    regulation_name = LEGISLATION.get(celex, {}).get("name")
+    regulation_id = regulation_name or celex
 
     # The universal parser returns a dict with 'provisions' and 'relations'.
     # Older parsers returned (provisions, relations). Support both.
@@ -170,13 +198,12 @@ def parse_document(html_file: Path, lang: str, celex: str, out_dir: Path) -> Pat
             "Preamble supplement: grafted %d recital(s) into %s.", grafted, celex,
         )
 
-    regulation_name = LEGISLATION.get(celex, {}).get("name")
     out: Dict[str, Any] = {
         "graph_version": "0.1",
         "celex_id": celex,
-        "regulation_id": regulation_name or celex,
+        "regulation_id": regulation_id,
         "source_name": regulation_name or "unknown",
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
         "provisions": provisions,
         "relations": relations,
     }
@@ -188,7 +215,7 @@ def parse_document(html_file: Path, lang: str, celex: str, out_dir: Path) -> Pat
 
     # Extract DefinedTerm nodes and DEFINED_BY relations (Layer 1 semantic layer)
     defined_terms, dt_relations = extract_defined_terms(
-        provisions, celex, regulation_name or celex
+        provisions, celex, regulation_id
     )
     relations.extend(dt_relations)
     out["defined_terms"] = defined_terms
@@ -198,7 +225,6 @@ def parse_document(html_file: Path, lang: str, celex: str, out_dir: Path) -> Pat
 
     out_dir.mkdir(parents=True, exist_ok=True)
     out_file = out_dir / "parsed.json"
-    with out_file.open("w", encoding="utf-8") as fh:
-        json.dump(out, fh, ensure_ascii=False, indent=2)
+    _write_json(out_file, out)
 
     return out_file
@@ -14,7 +14,7 @@ import json
 import logging
 import os
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
@@ -171,6 +171,34 @@ def clean_mdcg_markdown(raw: str) -> tuple[str, dict]:
 
 # ── Flowchart extraction ──────────────────────────────────────────────────
 
+# Compiled once at import: extract_flowcharts applies the step patterns to
+# every chart block, step and fallback line.
+_CHART_HEADING_RE = re.compile(
+    r"^#{1,6}\s+.*?"
+    r"(?:(Main\s+Chart)|(?:Chart\s+)([A-E]))"
+    r"(?:\s*[:\-–—]\s*(.+?))?$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_CHART_BODY_RE = re.compile(
+    r"(?:^|\n)\s*\*\*(?:(Main\s+Chart)|Chart\s+([A-E])[^*]*)\*\*",
+    re.MULTILINE | re.IGNORECASE,
+)
+_STEP_RE = re.compile(
+    r"\*\*(?:Step\s+)?([A-Z]?\d+|[A-Z]|\d+)\*\*[:\s]*(.+?)"
+    r"(?=\n\s*[-*•]|\n\n|\Z)",
+    re.DOTALL,
+)
+_STEP_YES_RE = re.compile(r"[-*•]\s*\*?\*?Yes\*?\*?\s*[→:–\-]\s*(.+?)(?:\n|$)", re.I)
+_STEP_NO_RE = re.compile(r"[-*•]\s*\*?\*?No\*?\*?\s*[→:–\-]\s*(.+?)(?:\n|$)", re.I)
+_BOLD_QUESTION_RE = re.compile(r"\*\*(.{10,}?)(\?)?\*\*")
+_YES_LINE_RE = re.compile(r"[-*•]\s*\*?\*?Yes\b", re.I)
+_NO_LINE_RE = re.compile(r"[-*•]\s*\*?\*?No\b", re.I)
+_YES_PREFIX_RE = re.compile(r"^[-*•]\s*\*?\*?Yes\*?\*?\s*[→:–\-]?\s*", re.I)
+_NO_PREFIX_RE = re.compile(r"^[-*•]\s*\*?\*?No\*?\*?\s*[→:–\-]?\s*", re.I)
+_SECTION_REF_RE = re.compile(r"Section\s+(\d+(?:\.\d+)*)")
+_WS_RUN_RE = re.compile(r"\s+")
+
+
 def extract_flowcharts(md_text: str) -> list[dict]:
     """Extract decision-tree flowcharts from cleaned MDCG markdown.
 
@@ -179,19 +207,9 @@ def extract_flowcharts(md_text: str) -> list[dict]:
     """
     charts: list[dict] = []
 
-    chart_heading_pat = re.compile(
-        r"^#{1,6}\s+.*?"
-        r"(?:(Main\s+Chart)|(?:Chart\s+)([A-E]))"
-        r"(?:\s*[:\-–—]\s*(.+?))?$",
-        re.MULTILINE | re.IGNORECASE,
-    )
-    matches = list(chart_heading_pat.finditer(md_text))
+    matches = list(_CHART_HEADING_RE.finditer(md_text))
 
-    body_pat = re.compile(
-        r"(?:^|\n)\s*\*\*(?:(Main\s+Chart)|Chart\s+([A-E])[^*]*)\*\*",
-        re.MULTILINE | re.IGNORECASE,
-    )
-    for bm in body_pat.finditer(md_text):
+    for bm in _CHART_BODY_RE.finditer(md_text):
         near = any(abs(bm.start() - hm.start()) < 200 for hm in matches)
         if not near:
             matches.append(bm)
@@ -224,24 +242,15 @@ def extract_flowcharts(md_text: str) -> list[dict]:
 
         steps: list[dict] = []
 
-        step_re = re.compile(
-            r"\*\*(?:Step\s+)?([A-Z]?\d+|[A-Z]|\d+)\*\*[:\s]*(.+?)"
-            r"(?=\n\s*[-*•]|\n\n|\Z)",
-            re.DOTALL,
-        )
-        for sm in step_re.finditer(block):
+        for sm in _STEP_RE.finditer(block):
             step_id = sm.group(1).strip()
-            question = re.sub(r"\s+", " ", sm.group(2).strip()).rstrip("*").rstrip()
+            question = _WS_RUN_RE.sub(" ", sm.group(2).strip()).rstrip("*").rstrip()
             if not question.endswith("?"):
                 question += "?"
 
             after = block[sm.end() : sm.end() + 500]
-            yes_m = re.search(
-                r"[-*•]\s*\*?\*?Yes\*?\*?\s*[→:–\-]\s*(.+?)(?:\n|$)", after, re.I
-            )
-            no_m = re.search(
-                r"[-*•]\s*\*?\*?No\*?\*?\s*[→:–\-]\s*(.+?)(?:\n|$)", after, re.I
-            )
+            yes_m = _STEP_YES_RE.search(after)
+            no_m = _STEP_NO_RE.search(after)
 
             if chart_letter == "Main" and len(step_id) == 1:
                 sid = f"Main-{step_id}"
@@ -265,7 +274,7 @@ def extract_flowcharts(md_text: str) -> list[dict]:
                 s = line.strip()
                 if not s:
                     continue
-                qm = re.match(r"\*\*(.{10,}?)(\?)?\*\*", s)
+                qm = _BOLD_QUESTION_RE.match(s)
                 if qm:
                     idx += 1
                     q = qm.group(1).strip()
@@ -278,24 +287,14 @@ def extract_flowcharts(md_text: str) -> list[dict]:
                     steps.append(current_step)
                     continue
                 if current_step:
-                    if re.match(r"[-*•]\s*\*?\*?Yes\b", s, re.I):
-                        tail = re.sub(
-                            r"^[-*•]\s*\*?\*?Yes\*?\*?\s*[→:–\-]?\s*",
-                            "",
-                            s,
-                            flags=re.I,
-                        )
+                    if _YES_LINE_RE.match(s):
+                        tail = _YES_PREFIX_RE.sub("", s)
                         current_step["yes"] = tail.strip() or "significant"
-                    elif re.match(r"[-*•]\s*\*?\*?No\b", s, re.I):
-                        tail = re.sub(
-                            r"^[-*•]\s*\*?\*?No\*?\*?\s*[→:–\-]?\s*",
-                            "",
-                            s,
-                            flags=re.I,
-                        )
+                    elif _NO_LINE_RE.match(s):
+                        tail = _NO_PREFIX_RE.sub("", s)
                         current_step["no"] = tail.strip() or "non-significant"
 
-        ref_m = re.search(r"Section\s+(\d+(?:\.\d+)*)", block[:500])
+        ref_m = _SECTION_REF_RE.search(block[:500])
         charts.append(
             {
                 "chart_id": chart_letter,
@@ -400,7 +399,7 @@ async def _parse_pdf_async(
         "cleaned_chars": len(cleaned_md),
         "cleaning_metrics": cleaning_metrics,
         "flowcharts_count": len(flowcharts),
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
     }
     meta_path = output_dir / "metadata.json"
     meta_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8")
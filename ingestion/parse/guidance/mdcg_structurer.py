@@ -21,6 +21,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from ..base.utils import dumps_indented
+
 logger = logging.getLogger(__name__)
 
 # ── heading regex ──────────────────────────────────────────────────────────
@@ -488,8 +490,6 @@ def write_parsed_json(
     Path
         Path to the written ``parsed.json`` file.
     """
-    import json
-
     result = structure_mdcg(md_path, doc_id, doc_name, lang)
 
     if output_path is None:
@@ -498,8 +498,7 @@ def write_parsed_json(
         output_path = Path(output_path)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as fh:
-        json.dump(result, fh, indent=2, ensure_ascii=False)
+    output_path.write_bytes(dumps_indented(result))
 
     n_prov = len(result["provisions"])
     logger.info("Wrote %s — %d provisions.", output_path, n_prov)
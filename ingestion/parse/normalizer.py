@@ -32,7 +32,7 @@ from bs4 import BeautifulSoup, NavigableString, Tag
 # ── Detection ─────────────────────────────────────────────────────────────────
 
 # Consolidated HTML class names that never appear in the OJ format.
-_CONSOL_ONLY_CLASSES = {"norm", "modref", "grid-container", "grid-list", "arrow"}
+_CONSOL_ONLY_CLASSES = frozenset({"norm", "modref", "grid-container", "grid-list", "arrow"})
 
 
 def is_consolidated_html(html: str) -> bool:
@@ -59,7 +59,7 @@ _CLASS_MAP: dict[str, str] = {
 }
 
 # Multiple consolidated heading classes → single oj-ti-grseq-1
-_HEADING_CLASSES = {
+_HEADING_CLASSES = frozenset({
     "title-gr-seq-level-1",
     "title-gr-seq-level-2",
     "title-gr-seq-level-3",
@@ -67,17 +67,25 @@ _HEADING_CLASSES = {
     "title-gr-seq-level-5",
     "title-division-1",
     "title-division-2",
-}
+})
 
 # Annex title classes → oj-doc-ti
-_ANNEX_TITLE_CLASSES = {
+_ANNEX_TITLE_CLASSES = frozenset({
     "title-doc-first",
     "title-doc-last",
     "title-annex-1",
+})
+
+# All three renamings folded into one lookup (``_CLASS_MAP`` wins on overlap,
+# as it is checked first in the original precedence).
+_CLASS_REMAP: dict[str, str] = {
+    **dict.fromkeys(_ANNEX_TITLE_CLASSES, "oj-doc-ti"),
+    **dict.fromkeys(_HEADING_CLASSES, "oj-ti-grseq-1"),
+    **_CLASS_MAP,
 }
 
 # Classes to strip entirely (amendment markers / ToC / navigation)
-_STRIP_CLASSES = {
+_STRIP_CLASSES = frozenset({
     "modref",
     "arrow",
     "hd-modifiers",
@@ -89,7 +97,7 @@ _STRIP_CLASSES = {
     "toc-2",
     "toc-item",
     "anchorarrow",
-}
+})
 
 
 def _remap_classes(tag: Tag) -> None:
@@ -97,17 +105,8 @@ def _remap_classes(tag: Tag) -> None:
     classes = tag.get("class")
     if not classes:
         return
-    new_classes: list[str] = []
-    for cls in classes:
-        if cls in _CLASS_MAP:
-            new_classes.append(_CLASS_MAP[cls])
-        elif cls in _HEADING_CLASSES:
-            new_classes.append("oj-ti-grseq-1")
-        elif cls in _ANNEX_TITLE_CLASSES:
-            new_classes.append("oj-doc-ti")
-        else:
-            new_classes.append(cls)
-    tag["class"] = new_classes
+    remap = _CLASS_REMAP.get
+    tag["class"] = [remap(cls, cls) for cls in classes]
 
 
 # ── Amendment marker removal ──────────────────────────────────────────────────
@@ -251,25 +250,24 @@ def _grid_to_table(grid: Tag, soup: BeautifulSoup) -> Tag | None:
 
 # ── Paragraph reconstruction ─────────────────────────────────────────────────
 
-_PARA_NUM_RE = re.compile(r"^(\d+[a-z]?)\.\s*$")
+# Number and optional amendment letter are captured separately so ids are
+# built straight from the groups: "3a." → ("3", "a").
+_PARA_NUM_RE = re.compile(r"^(\d+)([a-z]?)\.\s*$")
+_ARTICLE_ID_RE = re.compile(r"^art_(\d+)([a-z]?)$")
 
 
 def _reconstruct_paragraphs(soup: BeautifulSoup) -> None:
     """Wrap article paragraph ``<div class="norm">`` blocks with proper
     ``<div id="ART.PAR">`` containers carrying the ``NNN.NNN`` format."""
-    article_re = re.compile(r"^art_(\d+[a-z]?)$")
-
-    for article_div in soup.find_all("div", id=article_re):
-        art_match = article_re.match(article_div["id"])
+    for article_div in soup.find_all("div", id=_ARTICLE_ID_RE):
+        art_match = _ARTICLE_ID_RE.match(article_div["id"])
         if not art_match:
             continue
-        art_num_raw = art_match.group(1)
-        # Numeric part of the article number (zero-padded to 3 digits).
-        art_num_digits = int(re.match(r"(\d+)", art_num_raw).group(1))
-        # Include any alpha suffix (e.g. "a" for art_10a) so that amended articles
-        # get distinct paragraph IDs: art_10 → "010.001", art_10a → "010a.001".
-        _art_alpha_m = re.search(r"([a-z]+)$", art_num_raw)
-        art_id_prefix = f"{art_num_digits:03d}{_art_alpha_m.group(1) if _art_alpha_m else ''}"
+        art_digits, art_suffix = art_match.groups()
+        # Numeric part zero-padded to 3 digits, plus any alpha suffix (e.g. "a"
+        # for art_10a) so that amended articles get distinct paragraph IDs:
+        # art_10 → "010.001", art_10a → "010a.001".
+        art_id_prefix = f"{int(art_digits):03d}{art_suffix}"
 
         # Collect direct child <div class="oj-normal"> (after class remap)
         # that contain a <span class="no-parag"> with a paragraph number.
@@ -293,16 +291,10 @@ def _reconstruct_paragraphs(soup: BeautifulSoup) -> None:
             if not m:
                 continue
 
-            para_label = m.group(1)  # e.g. "3" or "3a"
-            # For numeric-only labels use the number; for "3a" keep as-is
-            try:
-                para_num_int = int(para_label)
-                para_id = f"{art_id_prefix}.{para_num_int:03d}"
-            except ValueError:
-                # e.g. "3a" → "120.003a" (or "120a.003a" for an amended article)
-                num_part = int(re.match(r"(\d+)", para_label).group(1))
-                suffix = re.search(r"([a-z]+)$", para_label).group(1)
-                para_id = f"{art_id_prefix}.{num_part:03d}{suffix}"
+            # "3" → "120.003"; "3a" → "120.003a" (or "120a.003a" for an
+            # amended article)
+            para_digits, para_suffix = m.groups()
+            para_id = f"{art_id_prefix}.{int(para_digits):03d}{para_suffix}"
             para_counter += 1
 
             # Build a new wrapper div
@@ -317,8 +309,10 @@ def _reconstruct_paragraphs(soup: BeautifulSoup) -> None:
                 # Flatten all content (including inline tags) into a single <p class="oj-normal">
                 p = soup.new_tag("p")
                 p["class"] = ["oj-normal"]
-                # Use decode_contents() to preserve all inline tags (e.g. <span class="italics">)
-                p.append(BeautifulSoup(inline_div.decode_contents(), "html.parser"))
+                # Move the nodes across (keeps inline tags such as
+                # <span class="italics">) rather than re-parsing their markup.
+                for node in list(inline_div.contents):
+                    p.append(node.extract())
                 wrapper.append(p)
                 # Also move any tables or block elements after the inline_div
                 for sib in list(child.children):
@@ -372,7 +366,10 @@ def normalize_consolidated_html(html: str) -> str:
     if not is_consolidated_html(html):
         return html
 
-    soup = BeautifulSoup(html, "html.parser")
+    # The C-backed lxml builder, as the parser itself uses; the normalised
+    # output is re-parsed with lxml anyway, so its tree repairs apply here
+    # first instead of later.
+    soup = BeautifulSoup(html, "lxml")
 
     # 1. Strip amendment markers (must come first — before class remap)
     _strip_amendment_markers(soup)
@@ -80,7 +80,11 @@ def extract_raw_refs(text: str) -> list[dict[str, Any]]:
     priority order from ALL_PATTERNS is respected (relative > explicit >
     range > external).
     """
-    clean = FOOTNOTE_MARKER.sub("", text)
+    return _extract_refs_from_clean(FOOTNOTE_MARKER.sub("", text))
+
+
+def _extract_refs_from_clean(clean: str) -> list[dict[str, Any]]:
+    """:func:`extract_raw_refs` for text already stripped of footnote markers."""
     results: list[dict[str, Any]] = []
     for category, pattern in ALL_PATTERNS.items():
         for m in pattern.finditer(clean):
@@ -128,6 +132,8 @@ def _deduplicate_overlaps(refs: list[dict[str, Any]]) -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 _NUM_RE = re.compile(r"\d+(?:\(\d+\))?")
+_BASE_NUM_RE = re.compile(r"^\(?(\d+)")
+_DECIMAL_NUM_RE = re.compile(r"\d+\.\d+")
 
 
 def expand_range_ref(groups: dict[str, str]) -> list[str]:
@@ -161,7 +167,7 @@ def expand_range_ref(groups: dict[str, str]) -> list[str]:
 
 def _extract_base_num(s: str) -> int | None:
     """Extract the leading integer from a string like '5(2)' → 5, or '109' → 109."""
-    m = re.match(r"^\(?(\d+)", s)
+    m = _BASE_NUM_RE.match(s)
     return int(m.group(1)) if m else None
 
 
@@ -191,7 +197,7 @@ class CrossReferenceResolver:
         self.celex = celex
         self.provisions = provisions
         self._by_id: dict[str, dict] = {p["id"]: p for p in provisions}
-        self._index = _build_provision_index(celex, provisions)
+        self._index = _build_provision_index(celex, provisions, self._by_id)
 
     _ORDINAL_MAP: dict[str, str] = {
         "first": "1", "second": "2", "third": "3",
@@ -239,8 +245,10 @@ class CrossReferenceResolver:
             if not text:
                 continue
 
+            # Strip footnote markers once; extraction and external-ref
+            # qualification both work on the cleaned text.
             clean_text = FOOTNOTE_MARKER.sub("", text)
-            raw_refs = extract_raw_refs(text)
+            raw_refs = _extract_refs_from_clean(clean_text)
             source_id = prov["id"]
 
             for ref in raw_refs:
@@ -740,7 +748,7 @@ class CrossReferenceResolver:
         """Expand decimal annex-point enumeration into individual point numbers."""
         nums = [groups.get("dec_start", "")]
         middle = groups.get("dec_middle", "") or ""
-        for m in re.finditer(r"\d+\.\d+", middle):
+        for m in _DECIMAL_NUM_RE.finditer(middle):
             nums.append(m.group())
         last = groups.get("dec_last")
         if last:
@@ -768,8 +776,12 @@ class CrossReferenceResolver:
 # Provision index builder
 # ---------------------------------------------------------------------------
 
+_ANCESTOR_KINDS = ("chapter", "article", "paragraph", "point", "annex")
+
+
 def _build_provision_index(
     celex: str, provisions: list[dict],
+    by_id: dict[str, dict] | None = None,
 ) -> dict[tuple[str, str], str]:
     """Build a lookup index: (kind, compound_key) → provision ID.
 
@@ -785,27 +797,50 @@ def _build_provision_index(
       - chapter:         number                          (e.g. "III")
       - section:         chapter_num.number                (e.g. "III.1")
       - recital:         number                          (e.g. "170")
+
+    *by_id* may be passed in when the caller already holds an id → provision
+    map, so the provision list is not scanned a second time.
     """
     index: dict[tuple[str, str], str] = {}
-    # Pre-build parent lookup
-    by_id: dict[str, dict] = {p["id"]: p for p in provisions}
-
-    def _ancestor_number(prov: dict, target_kind: str) -> str | None:
-        pid = prov.get("parent_id")
+    # Pre-build parent lookup (reuse the caller's if supplied)
+    if by_id is None:
+        by_id = {p["id"]: p for p in provisions}
+
+    # Nearest-ancestor numbers, one slot per kind in _ANCESTOR_KINDS, as seen
+    # by the *children* of a node.  Memoised per node so each parent chain is
+    # walked once for the whole document instead of once per lookup.
+    below: dict[str, tuple[str | None, ...]] = {}
+    no_ancestors: tuple[str | None, ...] = (None,) * len(_ANCESTOR_KINDS)
+
+    def _numbers_below(pid: str | None) -> tuple[str | None, ...]:
+        chain: list[dict] = []
+        numbers = no_ancestors
         while pid:
-            parent = by_id.get(pid)
-            if not parent:
+            if pid in below:
+                numbers = below[pid]
                 break
-            if parent.get("kind") == target_kind:
-                return parent.get("number")
-            pid = parent.get("parent_id")
-        return None
+            node = by_id.get(pid)
+            if not node:
+                break
+            chain.append(node)
+            pid = node.get("parent_id")
+        for node in reversed(chain):
+            kind = node.get("kind")
+            numbers = tuple(
+                node.get("number") if kind == k else n
+                for k, n in zip(_ANCESTOR_KINDS, numbers)
+            )
+            below[node["id"]] = numbers
+        return numbers
 
     for prov in provisions:
         kind = prov.get("kind", "")
         number = prov.get("number")
         if not number:
             continue
+        chapter_num, art_num, para_num, pt_num, annex_num = (
+            _numbers_below(prov.get("parent_id"))
+        )
 
         if kind == "article":
             index[("article", number)] = prov["id"]
@@ -814,7 +849,6 @@ def _build_provision_index(
         elif kind == "chapter":
             index[("chapter", number)] = prov["id"]
         elif kind == "section":
-            chapter_num = _ancestor_number(prov, "chapter")
             if chapter_num:
                 index[("section", f"{chapter_num}.{number}")] = prov["id"]
             else:
@@ -822,37 +856,27 @@ def _build_provision_index(
         elif kind == "recital":
             index[("recital", number)] = prov["id"]
         elif kind == "paragraph":
-            art_num = _ancestor_number(prov, "article")
             if art_num:
                 index[("paragraph", f"{art_num}.{number}")] = prov["id"]
         elif kind == "subparagraph":
-            art_num = _ancestor_number(prov, "article")
-            para_num = _ancestor_number(prov, "paragraph")
             if art_num and para_num:
                 index[("subparagraph", f"{art_num}.{para_num}.{number}")] = prov["id"]
         elif kind == "point":
-            art_num = _ancestor_number(prov, "article")
-            para_num = _ancestor_number(prov, "paragraph")
             if art_num and para_num:
                 index[("point", f"{art_num}.{para_num}.{number}")] = prov["id"]
             elif art_num:
                 # Direct article-level points (e.g. definitions article — no paragraph)
                 index[("point", f"{art_num}.{number}")] = prov["id"]
         elif kind == "roman_item":
-            art_num = _ancestor_number(prov, "article")
-            para_num = _ancestor_number(prov, "paragraph")
-            pt_num = _ancestor_number(prov, "point")
             if art_num and para_num and pt_num:
                 index[("roman_item", f"{art_num}.{para_num}.{pt_num}.{number}")] = prov["id"]
             elif art_num and pt_num:
                 # Direct article-level roman items (under a no-paragraph point)
                 index[("roman_item", f"{art_num}.{pt_num}.{number}")] = prov["id"]
         elif kind == "annex_section":
-            annex_num = _ancestor_number(prov, "annex")
             if annex_num:
                 index[("annex_section", f"{annex_num}.{number}")] = prov["id"]
         elif kind == "annex_point":
-            annex_num = _ancestor_number(prov, "annex")
             if annex_num:
                 index[("annex_point", f"{annex_num}.{number}")] = prov["id"]
 
@@ -122,6 +122,8 @@ _QUALIFIED_ANNEX_RE = re.compile(
 _OF_UNKNOWN_RE = re.compile(
     r"\s+of\s+(?:the\s+)?(?P<name>[A-Z][A-Za-z]+)\b",
 )
+# "(k) of the EHDS": optional sub-parts, then an all-caps abbreviation.
+_OF_ABBR_RE = re.compile(r"(?:\([a-z0-9]+\))*\s+of\s+(?:the\s+)?([A-Z]{2,})\b")
 
 
 # ---------------------------------------------------------------------------
@@ -279,10 +281,9 @@ def _qualified_by_unknown(text: str, end_pos: int) -> bool:
     NOT a known regulation short name.  This filters false positives like
     'Article 2(2)(k) of the EHDS' without blocking legitimate patterns
     like 'Article 120(3) of the Medical Device Regulation …'."""
-    tail = text[end_pos:]
     # Skip optional extra parenthesised sub-parts the article regex
     # didn't consume, e.g. "(k)" after Article 2(2).
-    m = re.match(r"(?:\([a-z0-9]+\))*\s+of\s+(?:the\s+)?([A-Z]{2,})\b", tail)
+    m = _OF_ABBR_RE.match(text, end_pos)
     if m is None:
         return False
     abbr = m.group(1)
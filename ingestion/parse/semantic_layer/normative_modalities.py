@@ -6,6 +6,8 @@ Supports EN, DE, FR with conflict resolution, punctuation handling, and better d
 
 import re
 
+from domain.ontology.provision_roles import _emit_trie
+
 NORMATIVE_MODALITIES = {
     "EN": {
         "obligation": [
@@ -82,26 +84,100 @@ NORMATIVE_MODALITIES = {
 }
 
 
+# Characters that end the literal head of a modality pattern.
+_REGEX_META = frozenset("\\.^$*+?{}[]|()")
+# A remainder starting with one of these quantifies the head's last
+# character, which the trie would detach from it.
+_QUANTIFIERS = frozenset("*+?{")
+
+
+def _alternation(pats: list[str]) -> str:
+    r"""Join ``pats`` into one alternation, folding the ``\b``-anchored ones
+    into a trie over their literal heads.
+
+    ``\bshall not\b``, ``\bshall ensure\b`` and ``\bshall\b(?=…)`` become
+    ``\bshall(?:\ (?:ensure\b|not\b)|\b(?=…))``: the boundary and the shared
+    prefix are tested once per position instead of once per pattern, the
+    same keyword-trie idea as Aho-Corasick but within a single ``re``
+    pattern.  Literal heads are lower-cased, so compile with ``re.I``.
+    Patterns not starting with ``\b``, or whose literal head is followed
+    by a quantifier (``\bshalls?``), are appended unchanged.
+    """
+    trie: dict = {}
+    branches = []
+    for pat in pats:
+        if not pat.startswith(r"\b"):
+            branches.append(f"(?:{pat})")
+            continue
+        body = pat[2:]
+        i = 0
+        while i < len(body) and body[i] not in _REGEX_META:
+            i += 1
+        if body[i:i + 1] in _QUANTIFIERS:
+            branches.append(f"(?:{pat})")
+            continue
+        node = trie
+        for ch in body[:i].lower():
+            node = node.setdefault(ch, {})
+        node.setdefault(None, []).append(body[i:])
+
+    if trie:
+        branches.insert(0, r"\b" + _emit_trie(trie))
+    return "|".join(branches)
+
+
+# One alternation per language over every modality pattern: a single search
+# answers "does any pattern occur" without a per-pattern re cache lookup.
+_REQUIREMENT_SCANNERS = {
+    lang: re.compile(
+        _alternation([pat for p_list in patterns.values() for pat in p_list]),
+        re.I,
+    )
+    for lang, patterns in NORMATIVE_MODALITIES.items()
+}
+
+
 def is_requirement_text(text: str, lang: str) -> bool:
-    lang = lang.upper()
-    patterns = NORMATIVE_MODALITIES.get(lang, NORMATIVE_MODALITIES["EN"])
+    scanner = _REQUIREMENT_SCANNERS.get(lang.upper(), _REQUIREMENT_SCANNERS["EN"])
+    return scanner.search(text) is not None
+
+
+# Priority order for classify_requirement_type: a prohibition ("shall not")
+# must win over the obligation it contains ("shall").
+_REQUIREMENT_TYPE_ORDER = ("prohibition", "obligation", "permission", "definition")
+
+
+def _build_type_classifier(patterns: dict) -> re.Pattern:
+    """Compile one classifier regex for a language's modality table.
 
-    for p_list in patterns.values():
-        for pat in p_list:
-            if re.search(pat, text, re.I):
-                return True
-    return False
+    Each requirement type becomes a named lookahead branch that scans the
+    whole text; branches are tried in priority order and the first one that
+    finds any of its patterns wins, so ``match(text).lastgroup`` is the type
+    the sequential per-pattern loop would have returned.
+    """
+    branches = []
+    for req_type in _REQUIREMENT_TYPE_ORDER:
+        pats = patterns.get(req_type, [])
+        if pats:
+            branches.append(rf"(?=.*?(?P<{req_type}>{_alternation(pats)}))")
+    return re.compile("|".join(branches), re.I | re.S)
+
+
+_TYPE_CLASSIFIERS = {
+    lang: _build_type_classifier(patterns)
+    for lang, patterns in NORMATIVE_MODALITIES.items()
+}
 
 
 def classify_requirement_type(text: str, lang: str) -> str:
     lang = lang.upper()
-    patterns = NORMATIVE_MODALITIES.get(lang, NORMATIVE_MODALITIES["EN"])
-
-    flat_patterns = []
-    for req_type in ["prohibition", "obligation", "permission", "definition"]:
-        flat_patterns.extend([(req_type, pat) for pat in patterns.get(req_type, [])])
+    # The fused scanner finds the leftmost modality of any type in one pass;
+    # texts without one never reach the per-type lookaheads, and for the rest
+    # the classifier starts at that hit since nothing can match before it.
+    hit = _REQUIREMENT_SCANNERS.get(lang, _REQUIREMENT_SCANNERS["EN"]).search(text)
+    if hit is None:
+        return "other"
+    classifier = _TYPE_CLASSIFIERS.get(lang, _TYPE_CLASSIFIERS["EN"])
+    m = classifier.match(text, hit.start())
+    return m.lastgroup if m else "other"
 
-    for req_type, pat in flat_patterns:
-        if re.search(pat, text, re.I):
-            return req_type
-    return "other"
@@ -3,9 +3,9 @@ from __future__ import annotations
 import re
 from typing import Dict, List, Optional, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
-from ..base.utils import ParserContext
+from ..base.utils import ParserContext, text_outside_tables
 from domain.ontology.eurlex_html import (
 	ANNEX_ID_RE,
 	ANNEX_SKIP_ID,
@@ -17,19 +17,55 @@ from domain.ontology.eurlex_html import (
 )
 
 # ── Number / marker extraction ────────────────────────────────────────
-_DOTTED_NUM_RE = re.compile(r"^(\d+(?:\.\d+)*)\.\s+")     # "1.1.1.   text"
-_NUM_MARKER_RE = re.compile(r"^(\d+(?:\.\d+)*)\.?$")       # "1." or "1.1." (cell marker)
-_LETTER_RE     = re.compile(r"^\(([a-zA-Z]{1,2})\)$")      # "(a)", "(aa)"
-_DASH_RE       = re.compile(r"^[—–\-•]$")                  # em-dash, en-dash, hyphen, bullet
-_CHAPTER_RE    = re.compile(r"^Chapter\s+([IVXLCDM]+)", re.I)
-_PART_RE       = re.compile(r"^PART\s+([A-Z])\b", re.I)
-_SECTION_RE    = re.compile(r"^Section\s+([A-Z0-9]+)\.?\s*(.*)", re.I)
-_WS_RE         = re.compile(r"[\xa0\s]+")
+_DOTTED_NUM_RE = re.compile(r"^(?P<dotted_num>\d+(?:\.\d+)*)\.\s+")  # "1.1.1.   text"
+_DASH_MARKERS  = frozenset("—–-•")                         # em-dash, en-dash, hyphen, bullet
+_CHAPTER_RE    = re.compile(r"^Chapter\s+(?P<chapter_num>[IVXLCDM]+)", re.I)
+_PART_RE       = re.compile(r"^PART\s+(?P<part_letter>[A-Z])\b", re.I)
+_SECTION_RE    = re.compile(r"^Section\s+(?P<section_label>[A-Z0-9]+)\.?\s*(?P<section_rest>.*)", re.I)
+
+# The four heading markers as one alternation, tried in the order the
+# heading handler checks them; ``lastgroup`` names the marker that matched.
+# They start with distinct literals, so at most one branch can match.
+_HEADING_MARKER_RE = re.compile(
+	"|".join(
+		f"(?P<{name}>{rx.pattern})"
+		for name, rx in (
+			("chapter", _CHAPTER_RE), ("part", _PART_RE),
+			("section", _SECTION_RE), ("dotted", _DOTTED_NUM_RE),
+		)
+	),
+	re.I,
+)
 
 
 def _norm(text: str) -> str:
-	"""Collapse &nbsp; and whitespace runs into single spaces."""
-	return _WS_RE.sub(" ", text).strip()
+	r"""Collapse &nbsp; and whitespace runs into single spaces.
+
+	``str.split()`` breaks on the same Unicode whitespace (``\xa0``
+	included) as ``re``'s ``\s``, without a regex pass per cell.
+	"""
+	return " ".join(text.split())
+
+
+def _number_marker(token: str) -> Optional[str]:
+	r"""Return the number of a cell marker like "1." or "1.1.", else None.
+
+	Table markers are tiny and checked on every row, so plain string tests
+	are used instead of a regex (``isdecimal`` is exactly ``re``'s ``\d``).
+	"""
+	number = token[:-1] if token.endswith(".") else token
+	if all(part.isdecimal() for part in number.split(".")):
+		return number
+	return None
+
+
+def _letter_marker(token: str) -> Optional[str]:
+	"""Return the letter(s) of a marker like "(a)" or "(aa)", else None."""
+	if 3 <= len(token) <= 4 and token[0] == "(" and token[-1] == ")":
+		inner = token[1:-1]
+		if inner.isascii() and inner.isalpha():
+			return inner
+	return None
 
 
 def _parse_dotted(text: str) -> Optional[Tuple[str, str, int]]:
@@ -39,6 +75,10 @@ def _parse_dotted(text: str) -> Optional[Tuple[str, str, int]]:
 	"1.1.1.   text" → ("1.1.1", "text", 3)
 	"10.   HEADING" → ("10", "HEADING", 1)
 	"""
+	# Most body paragraphs are continuation prose; a dotted number must
+	# start with a digit, so skip the regex unless the first char is one.
+	if not text[:1].isdecimal():
+		return None
 	m = _DOTTED_NUM_RE.match(text)
 	if not m:
 		return None
@@ -46,22 +86,9 @@ def _parse_dotted(text: str) -> Optional[Tuple[str, str, int]]:
 	return num, text[m.end():].strip(), num.count(".") + 1
 
 
-def _cell_text(cell: Tag) -> str:
-	"""Text of a cell, stripping nested tables."""
-	clone = BeautifulSoup(str(cell), "html.parser")
-	for tbl in clone.find_all("table"):
-		tbl.decompose()
-	return clone.get_text(" ", strip=True)
-
-
-def _id_of(parent: Dict, number: str, celex: str) -> str:
+def _id_of(parent: Dict, number: str, ctx: ParserContext) -> str:
 	"""Build a node id rooted at the immediate parent: anx_VI_part_A_1.1"""
-	return f"{_suffix(parent, celex)}_{number}"
-
-
-def _suffix(node: Dict, celex: str) -> str:
-	"""Node-id part after the CELEX prefix."""
-	return node["id"].split(f"{celex}_", 1)[-1]
+	return f"{ctx.html_id_of(parent)}_{number}"
 
 
 # ── Public entry point ────────────────────────────────────────────────
@@ -88,25 +115,36 @@ def _parse_single_annex(
 	annex_div: Tag, html_id: str, ctx: ParserContext,
 	annexes_root: Dict, soup,
 ) -> None:
+	# Single pass over the direct children: oj-doc-ti <p>s are titles, the
+	# remaining p / table / div elements are body content in document order.
+	# Each body <p>'s normalised text is extracted here once; the handlers
+	# and the title lookahead read it from ``texts`` instead of re-walking.
+	titles: List[str] = []
+	elements: List[Tag] = []
+	texts: List[str] = []
+	for el in annex_div.children:
+		if not isinstance(el, Tag) or el.name not in ("p", "table", "div"):
+			continue
+		if CLASS_OJ_DOC_TI in (el.get("class") or []):
+			if el.name == "p":
+				t = _norm(el.get_text(" ", strip=True))
+				if t:
+					titles.append(t)
+			continue
+		elements.append(el)
+		texts.append(_norm(el.get_text(" ", strip=True)) if el.name == "p" else "")
+
 	# ── title ──
-	title_ps = annex_div.find_all("p", class_=CLASS_OJ_DOC_TI, recursive=False)
-	titles = [_norm(t.get_text(" ", strip=True)) for t in title_ps if t.get_text(strip=True)]
-	annex_title = titles[1] if len(titles) > 1 else (titles[0] if titles else _fallback_title(soup, html_id) or html_id)
+	annex_title = titles[1] if len(titles) > 1 else (titles[0] if titles else _fallback_title(soup, ctx, html_id) or html_id)
 
-	num_m = re.match(r"^anx_([A-Za-z0-9]+)$", html_id)
+	num_m = ANNEX_ID_RE.match(html_id)
+	first_node = len(ctx.provisions)
 	annex_node = ctx.make_node(
 		"annex", html_id, annex_title, annexes_root,
 		title=annex_title,
 		number=num_m.group(1) if num_m else None,
 	)
 
-	# Collect direct child elements (p, table, div) in document order.
-	elements: List[Tag] = [
-		el for el in annex_div.children
-		if isinstance(el, Tag) and el.name in ("p", "table", "div")
-		and CLASS_OJ_DOC_TI not in (el.get("class") or [])
-	]
-
 	# ── Stack: (depth, node) ──
 	# depth -1 = annex root
 	# depth  0 = chapters / parts / named sections
@@ -121,19 +159,18 @@ def _parse_single_annex(
 
 		# ── <p class="oj-ti-grseq-1"> : heading ──
 		if el.name == "p" and CLASS_OJ_TI_GRSEQ_1 in cls:
-			i = _on_heading(elements, i, stack, annex_node, html_id, ctx, blt_cnt)
+			i = _on_heading(elements, texts, i, stack, annex_node, html_id, ctx, blt_cnt)
 			continue
 
 		# ── <p class="oj-normal"> : body paragraph ──
 		if el.name == "p" and CLASS_OJ_NORMAL in cls:
-			i = _on_paragraph(elements, i, stack, html_id, ctx)
+			i = _on_paragraph(texts, i, stack, html_id, ctx)
 			continue
 
 		# ── <p> with other/no class : treat as continuation ──
 		if el.name == "p":
-			text = _norm(el.get_text(" ", strip=True))
-			if text:
-				stack[-1][1]["text"] = f"{stack[-1][1]['text']} {text}".strip()
+			if texts[i]:
+				_append_text(stack, texts[i])
 			i += 1
 			continue
 
@@ -151,6 +188,8 @@ def _parse_single_annex(
 
 		i += 1
 
+	_flush_text(ctx.provisions[first_node:])
+
 
 # ── Stack helper ──────────────────────────────────────────────────────
 def _parent_for(stack: List[Tuple[int, Dict]], depth: int) -> Dict:
@@ -160,22 +199,51 @@ def _parent_for(stack: List[Tuple[int, Dict]], depth: int) -> Dict:
 	return stack[-1][1]
 
 
+def _append_text(stack: List[Tuple[int, Dict]], text: str) -> None:
+	"""Queue continuation *text* for the node on top of the stack.
+
+	Fragments are joined once by _flush_text when the annex is done;
+	re-concatenating the node text per fragment copied it K times for K
+	consecutive continuations.
+	"""
+	parts = stack[-1][1].setdefault("_text_parts", [])
+	text = text.rstrip()
+	if text:
+		parts.append(text)
+
+
+def _set_text(node: Dict, text: str) -> None:
+	"""Replace *node*'s text, dropping any queued continuation fragments."""
+	node.pop("_text_parts", None)
+	node["text"] = text
+
+
+def _flush_text(nodes: List[Dict]) -> None:
+	"""Join queued continuation fragments into each node's text."""
+	for node in nodes:
+		parts = node.pop("_text_parts", None)
+		if parts is not None:
+			node["text"] = " ".join([node["text"], *parts]).strip()
+
+
 # ── Heading handler (oj-ti-grseq-1) ──────────────────────────────────
 def _on_heading(
-	elements: List[Tag], i: int,
+	elements: List[Tag], texts: List[str], i: int,
 	stack: List[Tuple[int, Dict]], annex_node: Dict,
 	html_id: str, ctx: ParserContext, blt_cnt: Dict[str, int],
 ) -> int:
-	text = _norm(elements[i].get_text(" ", strip=True))
+	text = texts[i]
 	if not text:
 		return i + 1
 
+	m = _HEADING_MARKER_RE.match(text)
+	marker = m.lastgroup if m else None
+
 	# ── Chapter ──
-	m = _CHAPTER_RE.match(text)
-	if m:
+	if marker == "chapter":
 		parent = _parent_for(stack, 0)
-		roman = m.group(1)
-		title = _peek_title(elements, i + 1)
+		roman = m.group("chapter_num")
+		title = _peek_title(elements, texts, i + 1)
 		if title is not None:
 			i += 1  # consumed lookahead
 		node = ctx.make_node(
@@ -187,11 +255,10 @@ def _on_heading(
 		return i + 1
 
 	# ── Part ──
-	m = _PART_RE.match(text)
-	if m:
+	if marker == "part":
 		parent = _parent_for(stack, 0)
-		letter = m.group(1).upper()
-		title = _peek_title(elements, i + 1)
+		letter = m.group("part_letter").upper()
+		title = _peek_title(elements, texts, i + 1)
 		if title is not None:
 			i += 1
 		node = ctx.make_node(
@@ -203,11 +270,10 @@ def _on_heading(
 		return i + 1
 
 	# ── Named section ("Section A. …") ──
-	m = _SECTION_RE.match(text)
-	if m:
+	if marker == "section":
 		parent = _parent_for(stack, 0)
-		label = m.group(1)
-		content = m.group(2).strip() or text
+		label = m.group("section_label")
+		content = m.group("section_rest").strip() or text
 		node = ctx.make_node(
 			"annex_section", f"{html_id}_sec_{label}",
 			content, parent,
@@ -217,15 +283,16 @@ def _on_heading(
 		return i + 1
 
 	# ── Numbered heading ("1.   HEADING" / "1.1.   Sub") ──
-	parsed = _parse_dotted(text)
-	if parsed:
-		number, content, depth = parsed
+	if marker == "dotted":
+		number = m.group("dotted_num")
+		content = text[m.end():].strip()
+		depth = number.count(".") + 1
 		parent = _parent_for(stack, depth)
 		# Depth 1 = broad section (e.g. "1. ORGANISATIONAL REQUIREMENTS")
 		# Depth 2+ = subsection — the ideal retrieval anchor
 		kind = "annex_section" if depth <= 1 else "annex_subsection"
 		node = ctx.make_node(
-			kind, _id_of(parent, number, ctx.celex),
+			kind, _id_of(parent, number, ctx),
 			content, parent,
 			title=content, number=number,
 		)
@@ -236,38 +303,38 @@ def _on_heading(
 	# Before any numbered content → annex subtitle.
 	# After numbered content → title annotation on current parent.
 	if len(stack) == 1 and stack[0][0] == -1:
-		annex_node["text"] = text
+		_set_text(annex_node, text)
 		annex_node["title"] = text
 	else:
 		top = stack[-1][1]
 		kind = top.get("kind", "")
 		if kind in ("annex_chapter", "annex_part") and not top.get("children"):
 			top["title"] = text
-			top["text"] = text
+			_set_text(top, text)
 		else:
-			top["text"] = f"{top['text']} {text}".strip()
+			_append_text(stack, text)
 	return i + 1
 
 
-def _peek_title(elements: List[Tag], idx: int) -> Optional[str]:
+def _peek_title(elements: List[Tag], texts: List[str], idx: int) -> Optional[str]:
 	"""Look ahead for an unnumbered oj-ti-grseq-1 that serves as title."""
 	if idx >= len(elements):
 		return None
 	nxt = elements[idx]
 	if nxt.name != "p" or CLASS_OJ_TI_GRSEQ_1 not in (nxt.get("class") or []):
 		return None
-	t = _norm(nxt.get_text(" ", strip=True))
-	if _parse_dotted(t) or _CHAPTER_RE.match(t) or _PART_RE.match(t) or _SECTION_RE.match(t):
+	t = texts[idx]
+	if _HEADING_MARKER_RE.match(t):
 		return None  # it's a numbered heading, not a title
 	return t or None
 
 
 # ── Body paragraph handler (oj-normal) ────────────────────────────────
 def _on_paragraph(
-	elements: List[Tag], i: int,
+	texts: List[str], i: int,
 	stack: List[Tuple[int, Dict]], html_id: str, ctx: ParserContext,
 ) -> int:
-	text = _norm(elements[i].get_text(" ", strip=True))
+	text = texts[i]
 	if not text:
 		return i + 1
 
@@ -276,14 +343,14 @@ def _on_paragraph(
 		number, content, depth = parsed
 		parent = _parent_for(stack, depth)
 		node = ctx.make_node(
-			"annex_point", _id_of(parent, number, ctx.celex),
+			"annex_point", _id_of(parent, number, ctx),
 			content, parent, number=number,
 		)
 		stack.append((depth, node))
 		return i + 1
 
 	# Continuation text
-	stack[-1][1]["text"] = f"{stack[-1][1]['text']} {text}".strip()
+	_append_text(stack, text)
 	return i + 1
 
 
@@ -301,25 +368,24 @@ def _on_table(
 		# Determine marker & body depending on column count
 		if len(cells) >= 3:
 			marker = _norm(cells[1].get_text(" ", strip=True))
-			body = _cell_text(cells[2])
+			body = text_outside_tables(cells[2])
 			content_cell = cells[2]
 		elif len(cells) == 2:
 			marker = _norm(cells[0].get_text(" ", strip=True))
-			body = _cell_text(cells[1])
+			body = text_outside_tables(cells[1])
 			content_cell = cells[1]
 		else:
-			body = _cell_text(cells[0])
-			stack[-1][1]["text"] = f"{stack[-1][1]['text']} {body}".strip()
+			body = text_outside_tables(cells[0])
+			_append_text(stack, body)
 			continue
 
 		# ── Dotted-number marker ──
-		nm = _NUM_MARKER_RE.match(marker)
-		if nm:
-			number = nm.group(1)
+		number = _number_marker(marker)
+		if number is not None:
 			depth = number.count(".") + 1
 			parent = _parent_for(stack, depth)
 			node = ctx.make_node(
-				"annex_point", _id_of(parent, number, ctx.celex),
+				"annex_point", _id_of(parent, number, ctx),
 				body, parent, number=number,
 			)
 			stack.append((depth, node))
@@ -327,25 +393,25 @@ def _on_table(
 			continue
 
 		# ── Letter marker ──
-		lm = _LETTER_RE.match(marker)
-		if lm:
-			letter = lm.group(1).lower()
+		letter = _letter_marker(marker)
+		if letter is not None:
+			letter = letter.lower()
 			parent = stack[-1][1]
 			ctx.make_node(
 				"annex_subpoint",
-				f"{_suffix(parent, ctx.celex)}_{letter}",
+				f"{ctx.html_id_of(parent)}_{letter}",
 				body, parent, number=letter,
 			)
 			_process_nested_tables(content_cell, stack, html_id, ctx, blt_cnt)
 			continue
 
 		# ── Dash / bullet marker ──
-		if _DASH_RE.match(marker):
+		if marker in _DASH_MARKERS:
 			parent = stack[-1][1]
-			blt_cnt[parent["id"]] = blt_cnt.get(parent["id"], 0) + 1
+			n = blt_cnt[parent["id"]] = blt_cnt.get(parent["id"], 0) + 1
 			ctx.make_node(
 				"annex_bullet",
-				f"{_suffix(parent, ctx.celex)}_blt_{blt_cnt[parent['id']]}",
+				f"{ctx.html_id_of(parent)}_blt_{n}",
 				body, parent,
 			)
 			_process_nested_tables(content_cell, stack, html_id, ctx, blt_cnt)
@@ -353,7 +419,7 @@ def _on_table(
 
 		# ── Fallback: append as continuation ──
 		combined = f"{marker} {body}".strip() if marker else body
-		stack[-1][1]["text"] = f"{stack[-1][1]['text']} {combined}".strip()
+		_append_text(stack, combined)
 
 
 def _process_nested_tables(
@@ -384,30 +450,29 @@ def _on_enum_spacing(
 		number, _, depth = parsed
 		parent = _parent_for(stack, depth)
 		node = ctx.make_node(
-			"annex_point", _id_of(parent, number, ctx.celex),
+			"annex_point", _id_of(parent, number, ctx),
 			body, parent, number=number,
 		)
 		stack.append((depth, node))
 		return
 
 	# Plain number marker (e.g. "1." in cell)
-	nm = _NUM_MARKER_RE.match(num_text)
-	if nm:
-		number = nm.group(1)
+	number = _number_marker(num_text)
+	if number is not None:
 		depth = number.count(".") + 1
 		parent = _parent_for(stack, depth)
 		node = ctx.make_node(
-			"annex_point", _id_of(parent, number, ctx.celex),
+			"annex_point", _id_of(parent, number, ctx),
 			body, parent, number=number,
 		)
 		stack.append((depth, node))
 		return
 
 	# Fallback: continuation
-	stack[-1][1]["text"] = f"{stack[-1][1]['text']} {num_text} {body}".strip()
+	_append_text(stack, f"{num_text} {body}")
 
 
 # ── Utility ───────────────────────────────────────────────────────────
-def _fallback_title(soup, html_id: str) -> Optional[str]:
-	node = soup.find("div", id=f"{html_id}.tit_1")
+def _fallback_title(soup, ctx: ParserContext, html_id: str) -> Optional[str]:
+	node = ctx.find_div(soup, f"{html_id}.tit_1")
 	return node.get_text(" ", strip=True) if node else None
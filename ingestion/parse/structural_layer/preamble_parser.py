@@ -7,13 +7,28 @@ from domain.ontology.eurlex_html import PREAMBLE_ID, CITATION_ID_RE, RECITAL_ID_
 
 
 def parse_preamble(soup, ctx: ParserContext, root: Dict) -> Optional[Dict]:
-	preamble_div = soup.find("div", id=PREAMBLE_ID)
+	preamble_div = ctx.find_div(soup, PREAMBLE_ID)
 	if not preamble_div:
 		return None
 
 	preamble_node = ctx.make_node("preamble", "preamble", "", root)
 
-	for cit_div in preamble_div.find_all("div", id=CITATION_ID_RE):
+	# One walk over the preamble's id-bearing divs collects both citations and
+	# recitals; citations are still emitted first, as in the document.
+	citation_divs = []
+	recital_divs = []
+	for div in preamble_div.descendants:
+		if div.name != "div":
+			continue
+		div_id = div.get("id")
+		if div_id is None:
+			continue
+		if CITATION_ID_RE.search(div_id):
+			citation_divs.append(div)
+		elif RECITAL_ID_RE.search(div_id):
+			recital_divs.append(div)
+
+	for cit_div in citation_divs:
 		number = cit_div.get("id", "").split("_")[-1]
 		ctx.make_node(
 			"citation",
@@ -23,7 +38,6 @@ def parse_preamble(soup, ctx: ParserContext, root: Dict) -> Optional[Dict]:
 			number=number,
 		)
 
-	recital_divs = preamble_div.find_all("div", id=RECITAL_ID_RE)
 	if recital_divs:
 		for rec_div in recital_divs:
 			number = rec_div.get("id", "").split("_")[-1]
@@ -19,12 +19,15 @@ from domain.ontology.eurlex_html import CLASS_ELI_MAIN_TITLE, MAIN_TITLE_ID
 
 # Public entry point used by the registry
 def parse_eurlex_html(html_content: str, celex: str, regulation_id: str, lang: str = "EN") -> Dict:
-	soup = BeautifulSoup(html_content, "html.parser")
+	soup = BeautifulSoup(html_content, "lxml")
 	ctx = ParserContext(celex=celex, lang=lang)
 
 	# Root document node
 	main_title = None
-	main_title_div = soup.find("div", class_=CLASS_ELI_MAIN_TITLE, id=MAIN_TITLE_ID)
+	main_title_div = ctx.find_div(soup, MAIN_TITLE_ID)
+	if main_title_div is not None and CLASS_ELI_MAIN_TITLE not in (main_title_div.get("class") or []):
+		# An earlier "tit_1" div without the ELI class; search past it.
+		main_title_div = soup.find("div", class_=CLASS_ELI_MAIN_TITLE, id=MAIN_TITLE_ID)
 	if main_title_div:
 		main_title = main_title_div.get_text(" ", strip=True)
 	root = ctx.make_node("document", "document", main_title or regulation_id or celex, None)
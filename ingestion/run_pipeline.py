@@ -30,8 +30,10 @@ Attributes:
 
 import argparse
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -40,8 +42,10 @@ from .parse.dispatcher import parse_document
 from domain.legislation_catalog import LEGISLATION
 from domain.mdcg_catalog import MDCG_DOCUMENTS
 
+_BASE_DIR = Path(__file__).resolve().parents[1]
+
 # Load .env from project root (needed for LLAMA_CLOUD_API_KEY, etc.)
-_env_path = Path(__file__).resolve().parents[1] / ".env"
+_env_path = _BASE_DIR / ".env"
 load_dotenv(_env_path, override=False)
 
 DEFAULT_DOC = "32017R0745"
@@ -56,10 +60,13 @@ logger = logging.getLogger(__name__)
 
 # ── EUR-Lex regulation pipeline ───────────────────────────────────────────
 
-def _run_legislation(celex: str, lang: str) -> Optional[Path]:
-    """Scrape + parse an EUR-Lex legislative act (existing flow)."""
-    base_dir = Path(__file__).resolve().parents[1]
-    reg_dir = base_dir / "data" / "legislation" / celex / lang
+def _run_legislation(celex: str, lang: str, refresh: bool = False) -> Optional[Path]:
+    """Scrape + parse an EUR-Lex legislative act (existing flow).
+
+    With *refresh*, the act is re-fetched from EUR-Lex even if ``raw/`` or
+    the scrape cache already holds a copy.
+    """
+    reg_dir = _BASE_DIR / "data" / "legislation" / celex / lang
 
     reg_dir.mkdir(parents=True, exist_ok=True)
     raw_dir = reg_dir / "raw"
@@ -68,16 +75,21 @@ def _run_legislation(celex: str, lang: str) -> Optional[Path]:
     scrape_celex = LEGISLATION[celex].get("source_celex", celex)
 
     # The preamble supplement must never be mistaken for the main document
-    # (e.g. after `rm raw.html` in the re-scrape flow).
-    html_candidates = sorted(
-        f for f in raw_dir.glob("*.html") if f.name != "raw_preamble.html"
-    )
-    if html_candidates:
-        html_file = html_candidates[0]
+    # (e.g. after `rm raw.html` in the re-scrape flow).  The alphabetically
+    # first candidate is used so the choice does not depend on directory
+    # order; min() over entry names avoids building and sorting Paths.
+    with os.scandir(raw_dir) as entries:
+        html_name = min(
+            (e.name for e in entries
+             if e.name.endswith(".html") and e.name != "raw_preamble.html"),
+            default=None,
+        )
+    if html_name is not None and not refresh:
+        html_file = raw_dir / html_name
         logger.info("Using existing HTML: %s", html_file)
     else:
         try:
-            html_file = scrape_document(scrape_celex, lang, raw_dir)
+            html_file = scrape_document(scrape_celex, lang, raw_dir, use_cache=not refresh)
             logger.info("Scraped HTML to: %s", html_file)
         except Exception as e:
             logger.exception("Scraping failed for %s %s: %s", celex, lang, e)
@@ -91,9 +103,11 @@ def _run_legislation(celex: str, lang: str) -> Optional[Path]:
     # the fetch fails.
     if scrape_celex != celex:
         preamble_file = raw_dir / "raw_preamble.html"
-        if not preamble_file.exists():
+        if refresh or not preamble_file.exists():
             try:
-                scrape_document(celex, lang, raw_dir, filename="raw_preamble.html")
+                scrape_document(
+                    celex, lang, raw_dir, filename="raw_preamble.html", use_cache=not refresh,
+                )
                 logger.info("Scraped preamble supplement to: %s", preamble_file)
             except Exception as e:
                 logger.warning(
@@ -119,9 +133,8 @@ def _run_mdcg(doc_id: str, lang: str) -> Optional[Path]:
     from .parse.guidance.mdcg_structurer import write_parsed_json
 
     meta = MDCG_DOCUMENTS[doc_id]
-    base_dir = Path(__file__).resolve().parents[1]
 
-    doc_dir = base_dir / "data" / "guidance" / doc_id / lang
+    doc_dir = _BASE_DIR / "data" / "guidance" / doc_id / lang
     raw_dir = doc_dir / "raw"
     raw_dir.mkdir(parents=True, exist_ok=True)
 
@@ -183,7 +196,7 @@ def _run_mdcg(doc_id: str, lang: str) -> Optional[Path]:
 
 # ── Public entry point ────────────────────────────────────────────────────
 
-def run(doc_id: str, lang: str) -> Optional[Path]:
+def run(doc_id: str, lang: str, refresh: bool = False) -> Optional[Path]:
     """
     Execute the full data pipeline for a regulation or MDCG guidance document.
 
@@ -193,12 +206,14 @@ def run(doc_id: str, lang: str) -> Optional[Path]:
 
     :param doc_id: Document identifier (CELEX ID or MDCG doc ID).
     :param lang: ISO language code (e.g. ``EN``).
+    :param refresh: Re-fetch a regulation's HTML from EUR-Lex, bypassing
+        both ``raw/`` and the scrape cache.  Ignored for MDCG documents.
     """
     if doc_id in MDCG_DOCUMENTS:
         return _run_mdcg(doc_id, lang)
 
     if doc_id in LEGISLATION:
-        return _run_legislation(doc_id, lang)
+        return _run_legislation(doc_id, lang, refresh=refresh)
 
     logger.error(
         "Unknown document identifier: %s. "
@@ -208,19 +223,77 @@ def run(doc_id: str, lang: str) -> Optional[Path]:
     return None
 
 
+def _run_logged(doc_id: str, lang: str, refresh: bool) -> Optional[Path]:
+    """:func:`run`, with an unexpected exception logged and reported as None."""
+    try:
+        return run(doc_id, lang, refresh=refresh)
+    except Exception as e:  # one bad document must not stop the batch
+        logger.exception("Pipeline failed for %s %s: %s", doc_id, lang, e)
+        return None
+
+
+def run_many(
+    doc_ids: List[str], lang: str, workers: int = 1, refresh: bool = False,
+) -> Iterator[Tuple[str, Optional[Path]]]:
+    """
+    Run :func:`run` for several documents, yielding ``(doc_id, result)``.
+
+    With ``workers > 1`` up to that many documents are scraped and parsed
+    at once, one process each, and results are yielded as they finish;
+    otherwise documents run in order in this process.  Each worker may
+    launch its own Chromium against EUR-Lex, so keep *workers* small.
+    Closing the generator early cancels documents that have not started.
+
+    :param doc_ids: Document identifiers (CELEX or MDCG IDs).
+    :param lang: ISO language code (e.g. ``EN``).
+    :param workers: Maximum number of worker processes.
+    :param refresh: Passed through to :func:`run`.
+    """
+    if workers <= 1:
+        for doc_id in doc_ids:
+            yield doc_id, _run_logged(doc_id, lang, refresh)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {pool.submit(_run_logged, doc_id, lang, refresh): doc_id for doc_id in doc_ids}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="CRSS ingestion pipeline — regulations and MDCG guidance",
     )
     parser.add_argument(
         "--doc",
-        default=DEFAULT_DOC,
-        help="Document identifier — CELEX ID (e.g. 32017R0745) or MDCG doc ID (e.g. MDCG_2020_3)",
+        nargs="+",
+        default=[DEFAULT_DOC],
+        help="Document identifier(s) — CELEX ID (e.g. 32017R0745) or MDCG doc ID (e.g. MDCG_2020_3)",
     )
     # Deprecated alias kept for backward compatibility
     parser.add_argument("--celex", dest="doc", help=argparse.SUPPRESS)
     parser.add_argument("--lang", default=DEFAULT_LANG)
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-fetch regulation HTML from EUR-Lex, ignoring raw/ and the scrape cache",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Scrape + parse up to N of the given documents in parallel processes (default: 1)",
+    )
 
     args = parser.parse_args()
+    # --celex stores a single id
+    docs = [args.doc] if isinstance(args.doc, str) else args.doc
 
-    run(args.doc, args.lang)
+    if len(docs) == 1:
+        run(docs[0], args.lang, refresh=args.refresh)
+    else:
+        for _ in run_many(docs, args.lang, workers=args.jobs, refresh=args.refresh):
+            pass
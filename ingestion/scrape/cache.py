@@ -0,0 +1,54 @@
+"""On-disk cache of scraped EUR-Lex HTML.
+
+Each fetched page is stored under ``data/.scrape_cache/`` as
+``{sha1(url)}.html``; the file's modification time is its fetch time.  A
+cached page is served only while it is younger than the TTL and still
+carries the ELI main-title marker, so a truncated or interstitial page is
+never reused.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from domain.ontology.eurlex_html import CLASS_ELI_MAIN_TITLE
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / ".scrape_cache"
+DEFAULT_TTL_DAYS = 30
+
+
+def cache_path(url: str, cache_dir: Path = CACHE_DIR) -> Path:
+    """Return the cache file for *url* (which may not exist yet)."""
+    return cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+
+
+def lookup(url: str, ttl_days: float = DEFAULT_TTL_DAYS, cache_dir: Path = CACHE_DIR) -> Optional[Path]:
+    """Return the cached HTML file for *url*, or None if missing or stale."""
+    path = cache_path(url, cache_dir)
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        return None
+    if age > ttl_days * 86400:
+        logger.info("Scrape cache entry for %s is older than %s days", url, ttl_days)
+        return None
+    if CLASS_ELI_MAIN_TITLE not in path.read_text(encoding="utf-8", errors="replace"):
+        return None
+    return path
+
+
+def store(url: str, html: str, cache_dir: Path = CACHE_DIR) -> Path:
+    """Save *html* as the cached copy of *url* and return its path."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_path(url, cache_dir)
+    # Write-then-rename so a concurrent reader never sees a partial page.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(html, encoding="utf-8")
+    tmp.replace(path)
+    return path
@@ -1,15 +1,98 @@
 # crss_mvp/crss/ingestion/scrape.py
 
-from playwright.sync_api import sync_playwright
+import logging
+import shutil
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Optional
+
+import requests
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import sync_playwright
+
+from domain.ontology.eurlex_html import CLASS_ELI_MAIN_TITLE, MAIN_TITLE_ID
+
+from . import cache
+
+logger = logging.getLogger(__name__)
+
+# Only the HTML is saved, so sub-resources the page pulls in are dropped.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
 
-def scrape_document(celex: str, lang: str, out_dir: Path, filename: str = "raw.html") -> Path:
+
+def _block_subresources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _fetch_static(url: str) -> Optional[str]:
+    """Fetch *url* with a plain HTTP GET.
+
+    EUR-Lex serves act HTML server-rendered, so a browser is usually not
+    needed.  Returns None — and the caller falls back to Playwright — when
+    the request fails or the body is not a full act (e.g. a bot-check
+    interstitial), detected by the absence of the ELI main-title marker.
+    """
+    try:
+        response = requests.get(url, timeout=60)
+        response.raise_for_status()
+        html = response.content.decode("utf-8")
+    except (requests.exceptions.RequestException, UnicodeDecodeError) as e:
+        logger.info("Plain HTTP fetch failed for %s (%s); using Playwright", url, e)
+        return None
+    if CLASS_ELI_MAIN_TITLE not in html:
+        logger.info("Plain HTTP fetch of %s returned no act body; using Playwright", url)
+        return None
+    return html
+
+
+def _render(browser, url: str) -> str:
+    """Load *url* in a fresh browser context and return the rendered HTML."""
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        page.route("**/*", _block_subresources)
+        page.goto(url, wait_until="domcontentloaded")
+        try:
+            page.wait_for_selector(f"div#{MAIN_TITLE_ID}", timeout=15000)
+        except PlaywrightTimeoutError:
+            logger.warning("No main title in %s after 15s; saving the page as is", url)
+        return page.content()
+    finally:
+        context.close()
+
+
+@contextmanager
+def scrape_session() -> Iterator:
+    """Launch one headless Chromium to share across several scrapes.
+
+    Pass the yielded browser to :func:`scrape_document` so a batch of
+    documents pays the launch cost once; each document still gets its own
+    isolated browser context.
+    """
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            yield browser
+        finally:
+            browser.close()
+
+
+def scrape_document(
+    celex: str, lang: str, out_dir: Path, filename: str = "raw.html", browser=None,
+    use_cache: bool = True,
+) -> Path:
     """
     Scrapes an HTML document from EUR-Lex using its CELEX identifier.
 
-    This function uses Playwright to navigate to the EUR-Lex portal,
-    waits for the network to become idle to ensure the content is fully loaded,
-    and saves the raw HTML to the specified directory.
+    A fresh copy in the scrape cache (see :mod:`.cache`) is reused without
+    touching the network.  Otherwise the page is first fetched with a plain
+    HTTP request; only if that does not yield the act's HTML does this
+    function use Playwright to navigate to the EUR-Lex portal, with images,
+    fonts and stylesheets blocked, and waits until the document's main
+    title is in the DOM.  The raw HTML is saved to the specified directory.
 
     Args:
         celex: The unique CELEX identifier of the EU document (e.g., '32024R0590').
@@ -19,6 +102,11 @@ def scrape_document(celex: str, lang: str, out_dir: Path, filename: str = "raw.h
         filename: Output filename inside ``out_dir``.  The default is the
             main document ('raw.html'); the preamble supplement for
             consolidated acts is saved as 'raw_preamble.html'.
+        browser: Optional Playwright browser from :func:`scrape_session`.
+            When omitted, a browser is launched (and closed) only if the
+            plain HTTP fetch fails.
+        use_cache: Read from and write to the scrape cache.  Pass False to
+            force a fresh fetch (the result still refreshes the cache).
 
     Returns:
         Path: The path to the newly created HTML file.
@@ -33,14 +121,20 @@ def scrape_document(celex: str, lang: str, out_dir: Path, filename: str = "raw.h
 
     out_file = out_dir / filename
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto(url, wait_until="networkidle")
-
-        html = page.content()
-        out_file.write_text(html, encoding="utf-8")
+    cached = cache.lookup(url) if use_cache else None
+    if cached is not None:
+        logger.info("Using cached HTML for %s: %s", url, cached)
+        shutil.copyfile(cached, out_file)
+        return out_file
 
-        browser.close()
+    html = _fetch_static(url)
+    if html is None and browser is not None:
+        html = _render(browser, url)
+    elif html is None:
+        with scrape_session() as own_browser:
+            html = _render(own_browser, url)
+    out_file.write_text(html, encoding="utf-8")
+    if CLASS_ELI_MAIN_TITLE in html:
+        cache.store(url, html)
 
     return out_file
@@ -6,9 +6,72 @@ Handles both dict-based and list-based relation formats
 
 import json
 import sys
-from collections import Counter, defaultdict
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any, List, Union
+from typing import Callable, Dict, Any, Iterable, List, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ingestion.parse.base.utils import dumps_indented, orjson
+
+try:
+    import ijson  # type: ignore
+except ImportError:  # optional: stream huge files; json.load is the fallback
+    ijson = None
+
+_HEADER_KEYS = ("celex_id", "graph_version")
+
+# Auto-detected problems: (predicate, message) pairs, both called with the
+# report's hierarchy summary, its data-quality block and the full kind counts.
+_Rule = Callable[[Dict[str, Any], Dict[str, Any], Counter], Any]
+_ISSUE_RULES: List[Tuple[_Rule, _Rule]] = [
+    (lambda h, q, kinds: h["orphans"] > 5,
+     lambda h, q, kinds: f"⚠️ {h['orphans']} orphan provisions (no parent)"),
+    (lambda h, q, kinds: q["path_mismatches"] > 0,
+     lambda h, q, kinds: f"⚠️ {q['path_mismatches']} path[-1] ≠ parent_id mismatches"),
+    (lambda h, q, kinds: h["max_hierarchy_depth"] > 14,
+     lambda h, q, kinds: f"⚠️ Very deep hierarchy (max depth {h['max_hierarchy_depth']}) — check for cycles/over-nesting"),
+    (lambda h, q, kinds: h["roman_item_count"] == 0 and h["point_count"] > 30,
+     lambda h, q, kinds: "⚠️ No roman_item nodes but many points — parser may miss (i), (ii), …"),
+    (lambda h, q, kinds: "preamble" not in kinds or "enacting_terms" not in kinds,
+     lambda h, q, kinds: "⚠️ Missing 'preamble' and/or 'enacting_terms' top-level containers"),
+]
+
+
+def _stream_items(file_path: Path, prefix: str):
+    with open(file_path, "rb") as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+
+def _open_sections(file_path: Path) -> Tuple[Dict[str, Any], Iterable, Iterable]:
+    """Return ``(header, provisions, relations)`` for a parsed.json.
+
+    With ijson installed the two lists are streamed item by item, so the
+    document is never held in memory whole; otherwise the file is loaded
+    with json and the lists are returned as they are.
+    """
+    if ijson is None:
+        if orjson is not None:
+            data = orjson.loads(file_path.read_bytes())
+        else:
+            with open(file_path, encoding='utf-8') as f:
+                data = json.load(f)
+        header = {k: data[k] for k in _HEADER_KEYS if k in data}
+        return header, data.get("provisions", []), data.get("relations", [])
+
+    header: Dict[str, Any] = {}
+    with open(file_path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix in _HEADER_KEYS and event not in ("start_map", "start_array", "map_key"):
+                header[prefix] = value
+                if len(header) == len(_HEADER_KEYS):
+                    break
+    return (
+        header,
+        _stream_items(file_path, "provisions.item"),
+        _stream_items(file_path, "relations.item"),
+    )
+
 
 def analyze_graphrag_json(file_path: str):
     file_path = Path(file_path)
@@ -19,8 +82,8 @@ def analyze_graphrag_json(file_path: str):
     print(f"🔄 Loading {file_path.name} ... (this may take 10-60s for huge files)")
 
     try:
-        with open(file_path, encoding='utf-8') as f:
-            data = json.load(f)
+        header, provisions, relations = _open_sections(file_path)
+        report = _build_report(file_path, header, provisions, relations)
     except json.JSONDecodeError as e:
         print(f"❌ JSON decode error: {e}")
         return
@@ -28,16 +91,22 @@ def analyze_graphrag_json(file_path: str):
         print(f"❌ Error loading file: {e}")
         return
 
-    # Basic top-level checks
-    provisions: List[Dict] = data.get("provisions", [])
-    relations: List[Union[Dict, List]] = data.get("relations", [])
-    celex = data.get("celex_id", "UNKNOWN")
-    graph_version = data.get("graph_version", "UNKNOWN")
+    _emit_report(file_path, report)
+
 
-    print(f"✅ Loaded: {len(provisions):,} provisions | {len(relations):,} relations")
+def _build_report(
+    file_path: Path,
+    header: Dict[str, Any],
+    provisions: Iterable[Dict],
+    relations: Iterable[Union[Dict, List]],
+) -> Dict[str, Any]:
+    celex = header.get("celex_id", "UNKNOWN")
+    graph_version = header.get("graph_version", "UNKNOWN")
     print(f"   CELEX: {celex} | Graph version: {graph_version}\n")
 
     # === 1. PROVISION ANALYSIS ===
+    # Counters are updated per item so the pass stays constant-memory while
+    # provisions are streamed.
     kind_counter = Counter()
     depth_counter = Counter()
     orphan_count = 0
@@ -48,59 +117,65 @@ def analyze_graphrag_json(file_path: str):
     has_applies_to_count = 0
     has_semantic_role_count = 0
 
-    parent_to_children = defaultdict(list)
-    provision_dict = {}  # id → provision
+    n_provisions = 0
+    # First five kinds seen at each depth, for the deepest-kinds sample.
+    kinds_at_depth: Dict[Any, List[Any]] = {}
 
     for p in provisions:
-        pid = p.get("id")
+        n_provisions += 1
+        get = p.get
+        depth = get("hierarchy_depth")
+        is_number = isinstance(depth, (int, float))
+        if is_number:
+            sample = kinds_at_depth.setdefault(depth, [])
+            if len(sample) < 5:
+                sample.append(get("kind"))
+        pid = get("id")
         if not pid:
             continue
-        provision_dict[pid] = p
 
-        kind = p.get("kind", "UNKNOWN")
+        kind = get("kind", "UNKNOWN")
         kind_counter[kind] += 1
 
-        depth = p.get("hierarchy_depth")
-        if isinstance(depth, (int, float)):
+        if is_number:
             depth_counter[int(depth)] += 1
 
-        parent_id = p.get("parent_id")
-        if parent_id:
-            parent_to_children[parent_id].append(pid)
-        else:
+        parent_id = get("parent_id")
+        if not parent_id:
             root_count += 1
+            if kind != "document":
+                orphan_count += 1
+        else:
+            # Path consistency check (only meaningful with a parent)
+            path = get("path")
+            if path and isinstance(path, list) and path[-1] != parent_id:
+                path_mismatch_count += 1
 
-        if not parent_id and kind != "document":
-            orphan_count += 1
-
-        # Path consistency check
-        path = p.get("path", [])
-        if isinstance(path, list) and path and parent_id and path[-1] != parent_id:
-            path_mismatch_count += 1
-
-        if not p.get("text"):
+        if not get("text"):
             null_text_count += 1
 
-        if p.get("obligations"):
+        if get("obligations"):
             has_obligations_count += 1
-        if p.get("applies_to"):
+        if get("applies_to"):
             has_applies_to_count += 1
-        if p.get("semantic_role"):
+        if get("semantic_role"):
             has_semantic_role_count += 1
 
     # === 2. RELATION ANALYSIS (robust against list vs dict) ===
     relation_type_counter = Counter()
     relation_formats = Counter()
+    n_relations = 0
 
     for r in relations:
-        fmt = type(r).__name__
-        relation_formats[fmt] += 1
+        n_relations += 1
+        cls = type(r)
+        relation_formats[cls.__name__] += 1
 
         rel_type = None
 
-        if isinstance(r, dict):
+        if cls is dict:
             rel_type = r.get("type")
-        elif isinstance(r, list) and len(r) >= 3:
+        elif cls is list and len(r) >= 3:
             # possible formats: [source, target, type] or [source, target, {"type": ...}]
             if isinstance(r[2], str):
                 rel_type = r[2]
@@ -113,15 +188,16 @@ def analyze_graphrag_json(file_path: str):
 
     # === 3. HIERARCHY & QUALITY SUMMARY ===
     max_depth = max(depth_counter.keys(), default=0)
-    deepest_kinds_sample = [p["kind"] for p in provisions
-                           if p.get("hierarchy_depth") == max_depth][:5]
+    deepest_kinds_sample = kinds_at_depth.get(max_depth, [])
+
+    print(f"✅ Loaded: {n_provisions:,} provisions | {n_relations:,} relations")
 
     report = {
         "metadata": {
             "celex_id": celex,
             "graph_version": graph_version,
-            "total_provisions": len(provisions),
-            "total_relations": len(relations),
+            "total_provisions": n_provisions,
+            "total_relations": n_relations,
             "file_name": str(file_path)
         },
         "hierarchy_summary": {
@@ -141,7 +217,7 @@ def analyze_graphrag_json(file_path: str):
             "provisions_with_null_text": null_text_count,
             "path_mismatches": path_mismatch_count,
             "provisions_with_obligations": has_obligations_count,
-            "pct_with_obligations": round(100 * has_obligations_count / len(provisions), 1) if provisions else 0,
+            "pct_with_obligations": round(100 * has_obligations_count / n_provisions, 1) if n_provisions else 0,
             "provisions_with_applies_to": has_applies_to_count,
             "provisions_with_semantic_role": has_semantic_role_count,
         },
@@ -153,22 +229,24 @@ def analyze_graphrag_json(file_path: str):
     }
 
     # Auto-detect common problems
-    if orphan_count > 5:
-        report["issues"].append(f"⚠️ {orphan_count} orphan provisions (no parent)")
-    if path_mismatch_count > 0:
-        report["issues"].append(f"⚠️ {path_mismatch_count} path[-1] ≠ parent_id mismatches")
-    if max_depth > 14:
-        report["issues"].append(f"⚠️ Very deep hierarchy (max depth {max_depth}) — check for cycles/over-nesting")
-    if report["hierarchy_summary"]["roman_item_count"] == 0 and report["hierarchy_summary"]["point_count"] > 30:
-        report["issues"].append("⚠️ No roman_item nodes but many points — parser may miss (i), (ii), …")
-    if "preamble" not in kind_counter or "enacting_terms" not in kind_counter:
-        report["issues"].append("⚠️ Missing 'preamble' and/or 'enacting_terms' top-level containers")
+    hierarchy, quality = report["hierarchy_summary"], report["data_quality"]
+    report["issues"] = [
+        message(hierarchy, quality, kind_counter)
+        for applies, message in _ISSUE_RULES
+        if applies(hierarchy, quality, kind_counter)
+    ]
+
+    return report
 
+
+def _emit_report(file_path: Path, report: Dict[str, Any]) -> None:
     # === OUTPUT ===
     print("=" * 80)
     print("📊 EUR-LEX / GRAPHRAG ANALYSIS REPORT")
     print("=" * 80)
-    print(json.dumps(report, indent=2, ensure_ascii=False))
+    # Serialised once: the same text goes to stdout and to the saved report.
+    report_json = dumps_indented(report).decode("utf-8")
+    print(report_json)
 
     if report["issues"]:
         print("\n🚩 DETECTED ISSUES:")
@@ -178,16 +256,11 @@ def analyze_graphrag_json(file_path: str):
     # Save compact report
     report_path = file_path.with_name(f"{file_path.stem}_analysis_report.json")
     with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+        f.write(report_json)
 
     print(f"\n💾 Report saved → {report_path}")
     print("Done.")
 
-    # Optional: uncomment to see first few relations when debugging
-    # print("\nDebug — first 5 relations:")
-    # for i, r in enumerate(relations[:5]):
-    #     print(f"  {i}: {type(r).__name__} → {r}")
-
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Usage: python analyze_graphrag.py /path/to/your/parsed.json")
@@ -26,6 +26,8 @@ Quick start
     python scripts/build_all.py --docs 32024R1689 32016R0679   # subset
     python scripts/build_all.py --no-wipe        # incremental (keep existing)
     python scripts/build_all.py --no-summaries   # skip the LLM community summaries
+    python scripts/build_all.py --jobs 4         # scrape+parse 4 docs in parallel
+    python scripts/build_all.py --refresh        # re-fetch all EUR-Lex HTML
 
 Exit codes: 0 success · 1 a build stage raised · 2 preflight failed.
 """
@@ -36,6 +38,7 @@ import importlib.util
 import logging
 import os
 import sys
+from contextlib import closing
 from pathlib import Path
 
 # ── allow running from the project root without installing the package ────────
@@ -201,22 +204,22 @@ def preflight(docs: list[str], lang: str, *, want_summaries: bool, strict: bool)
 
 # ── build stages ───────────────────────────────────────────────────────────────
 
-def stage_ingest(docs: list[str], lang: str, *, strict: bool) -> dict[str, bool]:
-    from ingestion.run_pipeline import run as run_pipeline
+def stage_ingest(
+    docs: list[str], lang: str, *, strict: bool, jobs: int = 1, refresh: bool = False,
+) -> dict[str, bool]:
+    from ingestion.run_pipeline import run_many
 
     print(f"=== [1/5] Scrape & parse ({len(docs)} docs) ===")
     results: dict[str, bool] = {}
-    for i, doc in enumerate(docs, start=1):
-        print(f"  ({i}/{len(docs)}) {doc}")
-        try:
-            path = run_pipeline(doc, lang)
-            ok = path is not None
-        except Exception as exc:  # noqa: BLE001 — one bad doc shouldn't kill the build
-            logger.exception("  ingest failed for %s: %s", doc, exc)
-            ok = False
-        results[doc] = ok
-        if not ok and strict:
-            raise SystemExit(f"--strict: ingest failed for {doc}")
+    # run_many yields each document as it finishes (in order when jobs=1);
+    # closing it on a --strict abort cancels the documents not yet started.
+    with closing(run_many(docs, lang, workers=jobs, refresh=refresh)) as runs:
+        for i, (doc, parsed_json) in enumerate(runs, start=1):
+            ok = results[doc] = parsed_json is not None
+            print(f"  ({i}/{len(docs)}) {doc}{'' if ok else ' — FAILED'}")
+            if not ok and strict:
+                raise SystemExit(f"--strict: ingest failed for {doc}")
+    results = {doc: results[doc] for doc in docs}
     failed = [d for d, ok in results.items() if not ok]
     if failed:
         logger.warning("Ingest produced no parsed.json for: %s", ", ".join(failed))
@@ -368,6 +371,10 @@ def build_parser() -> argparse.ArgumentParser:
                    help="Skip the LLM community-summary stage.")
     p.add_argument("--check", action="store_true",
                    help="Run preflight only, then exit (no build work).")
+    p.add_argument("--jobs", type=int, default=1, metavar="N",
+                   help="Scrape + parse up to N documents in parallel processes (default: 1).")
+    p.add_argument("--refresh", action="store_true",
+                   help="Re-fetch regulation HTML from EUR-Lex, ignoring raw/ and the scrape cache.")
     p.add_argument("--strict", action="store_true",
                    help="Abort on the first per-doc ingest failure / missing MDCG dep.")
     p.add_argument("-y", "--yes", action="store_true",
@@ -393,7 +400,7 @@ def main() -> None:
     if wipe:
         _confirm_wipe(docs, args.yes)
 
-    ingest = stage_ingest(docs, args.lang, strict=args.strict)
+    ingest = stage_ingest(docs, args.lang, strict=args.strict, jobs=args.jobs, refresh=args.refresh)
     stage_load(args.lang, wipe=wipe)
     stage_embed()
     stage_canonicalize(no_communities=args.no_communities)
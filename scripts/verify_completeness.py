@@ -50,6 +50,7 @@ sys.path.insert(0, str(_PROJECT_ROOT))
 
 from domain.legislation_catalog import LEGISLATION
 from domain.mdcg_catalog import MDCG_DOCUMENTS
+from ingestion.parse.base.utils import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -150,6 +151,8 @@ def _load_parsed_json(path: Path) -> dict | None:
     """Load a parsed.json file, returning None if missing."""
     if not path.exists():
         return None
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with open(path, encoding="utf-8") as f:
         return json.load(f)
 
@@ -332,22 +335,23 @@ def verify_legislation_source(celex: str) -> list[Check]:
     )
 
     try:
-        from bs4 import BeautifulSoup
+        import lxml.html
     except ImportError:
         checks.append(Check(
-            name="beautifulsoup_available",
+            name="lxml_available",
             passed=False,
-            details=["pip install beautifulsoup4 for full HTML verification"],
+            details=["pip install lxml for full HTML verification"],
         ))
         return checks
 
     html_content = html_path.read_text(encoding="utf-8")
-    soup = BeautifulSoup(html_content, "html.parser")
+    # Only id attributes are inspected: collect them straight from the C tree
+    # instead of wrapping every element in a BeautifulSoup Tag.
+    tree = lxml.html.document_fromstring(html_content)
 
     # Extract all structural IDs from HTML
     html_ids: dict[str, list[str]] = defaultdict(list)
-    for elem in soup.find_all(id=True):
-        eid = elem["id"]
+    for eid in tree.xpath("//@id", smart_strings=False):
         if ARTICLE_ID_RE.match(eid):
             html_ids["article"].append(eid)
         elif PARAGRAPH_ID_RE.match(eid):
@@ -705,10 +709,11 @@ def verify_neo4j_parity(
 
             neo = neo4j_nodes[pid]
 
-            # Text content parity (SHA256 comparison)
+            # Text content parity; the SHA256 prefixes only label mismatches,
+            # so equal texts are never hashed.
             parsed_text = p.get("text") or ""
             neo_text = neo["text"] or ""
-            if _sha256(parsed_text) != _sha256(neo_text):
+            if parsed_text != neo_text:
                 text_mismatches.append(
                     f"{pid}: parsed={_sha256(parsed_text)}, "
                     f"neo4j={_sha256(neo_text)}"
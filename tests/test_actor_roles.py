@@ -13,6 +13,7 @@ from canonicalization.role_linker import (
     _build_includes_edges,
     _build_obligation_edges,
     _build_role_regex,
+    _build_role_scanner,
     _select_actor_terms,
     _title_is_role_named,
 )
@@ -45,6 +46,21 @@ def test_title_is_role_named_fires_only_on_bare_role_title():
     assert not _title_is_role_named("", ar_regex)
 
 
+# The single-pass role scanner must report every role a per-role regex would,
+# including a role nested inside a longer one at the same offset ("provider"
+# inside "downstream providers") and plural forms.
+def test_role_scanner_matches_per_role_regexes():
+    roles = [{"term": t} for t in ("provider", "downstream provider", "notified body", "body")]
+    scan = _build_role_scanner(roles)
+    text = "Downstream providers and notified bodies shall cooperate."
+    expected = {
+        idx for idx, role in enumerate(roles)
+        if _build_role_regex(role["term"]).search(text)
+    }
+    assert scan(text) == expected == {0, 1, 2, 3}
+    assert scan("providerless text") == set()
+
+
 def test_build_obligation_edges_links_role_named_title_without_modal():
     actor_terms = [
         {
@@ -75,6 +91,32 @@ def test_build_obligation_edges_links_role_named_title_without_modal():
     assert all(e["modality"] == "obligation" for e in edges)
 
 
+def test_build_obligation_edges_reads_numbered_first_sentence_modality():
+    actor_terms = [{"term_normalized": "importer", "celex": MDR_CELEX, "term": "importer"}]
+    provisions = [
+        {
+            "id": f"{MDR_CELEX}_art_13",
+            "celex": MDR_CELEX,
+            "title": "Falsified devices",
+            "text": "1. Importers Shall Not place falsified devices on the market. Second sentence.",
+        },
+        {
+            "id": f"{MDR_CELEX}_art_99",
+            "celex": MDR_CELEX,
+            "title": "Reports",
+            "text": "(a) The importer keeps records. The importer shall report.",
+        },
+    ]
+
+    edges = _build_obligation_edges(actor_terms, provisions)
+
+    # The leading "1." is skipped and the case-insensitive cue wins; the
+    # modal in the second sentence of art_99 is outside the first sentence.
+    assert [(e["provision_id"], e["modality"]) for e in edges] == [
+        (f"{MDR_CELEX}_art_13", "prohibition"),
+    ]
+
+
 def test_detect_role_specs_resolves_hospital_to_deployer_and_users():
     specs = detect_role_specs(
         "What must a hospital verify before putting a high-risk AI medical device into service?"
@@ -111,6 +153,16 @@ def test_detect_role_specs_routes_gdpr_controller_and_processor():
     ]
 
 
+def test_detect_role_specs_reports_phrases_nested_in_longer_ones():
+    # The single-scan matcher must still see "manufacturer" inside "product
+    # manufacturer" and "controller" inside "data controller".
+    specs = detect_role_specs("product manufacturer and data controller duties")
+
+    assert specs[0] == ("product_manufacturer", AI_ACT_CELEX)
+    assert ("manufacturer", MDR_CELEX) in specs
+    assert ("controller", GDPR_CELEX) in specs
+
+
 def test_detect_role_specs_gdpr_honors_celex_filter():
     # GDPR roles must not leak when the question is scoped to another regulation.
     assert detect_role_specs("controller duties", target_celexes={MDR_CELEX}) == []
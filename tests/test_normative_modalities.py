@@ -0,0 +1,85 @@
+"""Unit tests for the normative-modality classifier.
+
+The requirement type is decided by priority, not by position in the text: a
+prohibition anywhere outranks an earlier obligation, an obligation outranks
+a permission, and so on.
+"""
+from __future__ import annotations
+
+import random
+import re
+
+from ingestion.parse.semantic_layer.normative_modalities import (
+    NORMATIVE_MODALITIES,
+    _alternation,
+    classify_requirement_type,
+    is_requirement_text,
+)
+
+
+def test_classify_requirement_type_prefers_priority_over_position():
+    text = "The provider shall keep logs. The deployer shall not disable them."
+    assert classify_requirement_type(text, "EN") == "prohibition"
+    assert classify_requirement_type("Deployers may, and providers must, act.", "en") == "obligation"
+    assert classify_requirement_type("'provider' means a person", "EN") == "definition"
+    assert classify_requirement_type("Nothing normative here.", "EN") == "other"
+
+
+def test_classify_requirement_type_uses_language_table_with_en_fallback():
+    assert classify_requirement_type("Der Anbieter darf nicht", "DE") == "prohibition"
+    assert classify_requirement_type("Le fournisseur peut", "FR") == "permission"
+    assert classify_requirement_type("The provider shall", "IT") == "obligation"
+
+
+def test_is_requirement_text_matches_any_modality_of_the_language():
+    assert is_requirement_text("The provider SHALL keep logs.", "en")
+    assert is_requirement_text("'provider' means a person", "EN")
+    assert is_requirement_text("Der Anbieter muss", "DE")
+    assert not is_requirement_text("Der Anbieter shall", "DE")
+    assert is_requirement_text("The provider shall", "IT")
+    assert not is_requirement_text("The Mayor decided.", "EN")
+
+
+def test_classify_requirement_type_ignores_text_before_first_modality():
+    # The classifier resumes at the scanner's first hit; word boundaries there
+    # must still see the preceding character.
+    assert classify_requirement_type("Noshall not here", "EN") == "other"
+    assert classify_requirement_type("Recital text. Providers may act; they shall not.", "EN") == "prohibition"
+
+
+def test_alternation_folds_shared_literal_heads_into_a_trie():
+    pats = [r"\bshall\b(?=\s|$)", r"\bshall not\b", r"\bShall ensure\b", r"'[^']+'\s+means\b"]
+    folded = _alternation(pats)
+    assert folded.count("shall") == 1
+    scanner = re.compile(folded, re.I)
+    for text in ("SHALL ensure", "shall not", "it shall", "'x' means", "marshall not", "shallow"):
+        assert bool(scanner.search(text)) == any(re.search(p, text, re.I) for p in pats)
+
+
+def test_alternation_keeps_quantified_heads_whole():
+    # Split at "{", the quantifier would land inside "(?:{2}|\b)" and be
+    # read as literal text.
+    pats = [r"\bsee{2}\b", r"\bsee\b", r"\bshalls?\b", r"\bshall not\b"]
+    scanner = re.compile(_alternation(pats), re.I)
+    for text in ("see", "seee", "se", "see{2}", "shall", "shalls", "shall not", "shal"):
+        assert bool(scanner.search(text)) == any(re.search(p, text, re.I) for p in pats)
+
+
+def test_fused_modality_patterns_match_like_the_unfused_ones():
+    rng = random.Random(0)
+    for lang, patterns in NORMATIVE_MODALITIES.items():
+        groups = list(patterns.values()) + [[p for pats in patterns.values() for p in pats]]
+        words = sorted({w for pats in groups for p in pats for w in re.findall(r"[^\W\d_]+", p)})
+        texts = [
+            "".join(
+                rng.choice([rng.choice(words), rng.choice(words).upper(), " ", "'", '"', ",", ".", ":", "x"])
+                for _ in range(rng.randint(1, 12))
+            )
+            for _ in range(2000)
+        ]
+        for pats in groups:
+            fused = re.compile(_alternation(pats), re.I)
+            unfused = re.compile("|".join(f"(?:{p})" for p in pats), re.I)
+            for text in texts:
+                a, b = fused.search(text), unfused.search(text)
+                assert (a and a.start()) == (b and b.start()), (lang, pats, text)
@@ -14,6 +14,9 @@ from domain.legislation_catalog import (
 
 from domain.ontology.provision_roles import (
     PROVISION_ROLE_TAXONOMY,
+    _ACTOR_SUBJECT_RE,
+    _ACTOR_SUBJECTS,
+    _trie_alternation,
     classify_provision,
 )
 
@@ -358,3 +361,21 @@ def test_classifier_always_returns_confidence_in_range():
     for text, kind in samples:
         result = _classify(text, kind=kind)
         assert 0.0 <= result.confidence <= 1.0
+
+
+def test_trie_alternation_matches_exactly_the_listed_words():
+    import re
+
+    pattern = re.compile(r"(?:" + _trie_alternation(["provider", "providers", "processor", "product"]) + r")\Z")
+    assert pattern.pattern.startswith("(?:pro(?:")
+    for word in ("provider", "providers", "processor", "product"):
+        assert pattern.match(word)
+    for word in ("pro", "providerss", "process", "products"):
+        assert not pattern.match(word)
+
+
+def test_actor_subject_regex_matches_every_listed_subject_whole_word():
+    for subject in _ACTOR_SUBJECTS:
+        m = _ACTOR_SUBJECT_RE.search(f"The {subject.upper()} shall")
+        assert m and m.group(0).lower() == subject.lower()
+    assert not _ACTOR_SUBJECT_RE.search("personal data of endusers")
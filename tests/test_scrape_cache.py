@@ -0,0 +1,29 @@
+"""Unit tests for ``ingestion.scrape.cache``."""
+from __future__ import annotations
+
+import os
+import time
+
+from domain.ontology.eurlex_html import CLASS_ELI_MAIN_TITLE
+from ingestion.scrape import cache
+
+URL = "https://eur-lex.europa.eu/legal-content/EN/TXT/HTML/?uri=CELEX:32017R0745"
+ACT = f'<html><div class="{CLASS_ELI_MAIN_TITLE}">Regulation</div></html>'
+
+
+def test_store_then_lookup_round_trips(tmp_path):
+    path = cache.store(URL, ACT, cache_dir=tmp_path)
+    assert cache.lookup(URL, cache_dir=tmp_path) == path
+    assert path.read_text(encoding="utf-8") == ACT
+    assert cache.lookup(URL.replace("EN", "FR"), cache_dir=tmp_path) is None
+
+
+def test_lookup_rejects_stale_or_markerless_pages(tmp_path):
+    path = cache.store(URL, ACT, cache_dir=tmp_path)
+    old = time.time() - 31 * 86400
+    os.utime(path, (old, old))
+    assert cache.lookup(URL, ttl_days=30, cache_dir=tmp_path) is None
+    assert cache.lookup(URL, ttl_days=60, cache_dir=tmp_path) == path
+
+    cache.store(URL, "<html>Please verify you are human</html>", cache_dir=tmp_path)
+    assert cache.lookup(URL, cache_dir=tmp_path) is None
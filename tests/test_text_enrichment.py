@@ -0,0 +1,53 @@
+"""Unit tests for ``canonicalization.text_enrichment``.
+
+Flattening walks the provision tree bottom-up.  Annex trees can nest far
+deeper than the interpreter recursion limit once every bullet and sub-point
+becomes its own node, so the walk must not depend on Python recursion.
+"""
+from __future__ import annotations
+
+import sys
+
+from canonicalization.text_enrichment import _build_context_prefix, _flatten_all
+
+
+def test_flatten_all_joins_children_in_document_order():
+    provisions = [
+        {"id": "a", "kind": "article", "title": "T", "text": "T", "children": ["p1", "p2"]},
+        {"id": "p1", "kind": "paragraph", "text": "Stem:", "children": ["x"]},
+        {"id": "x", "kind": "point", "text": "first", "children": []},
+        {"id": "p2", "kind": "paragraph", "text": "second", "children": []},
+    ]
+    out: dict[str, str] = {}
+    _flatten_all(provisions, {p["id"]: p for p in provisions}, out)
+
+    # Title-only article takes its body from children; p1 keeps its stem.
+    assert out == {"a": "Stem: first second", "p1": "Stem: first", "x": "first", "p2": "second"}
+
+
+def test_flatten_all_handles_chains_deeper_than_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    provisions = [
+        {"id": f"n{i}", "kind": "annex_point", "text": "", "children": [f"n{i + 1}"]}
+        for i in range(depth)
+    ]
+    provisions.append({"id": f"n{depth}", "kind": "annex_point", "text": "leaf", "children": []})
+    out: dict[str, str] = {}
+    _flatten_all(provisions, {p["id"]: p for p in provisions}, out)
+
+    assert out["n0"] == "leaf"
+
+
+def test_context_prefix_cache_is_shared_by_siblings():
+    by_id = {
+        "c": {"id": "c", "kind": "chapter", "number": "I", "title": "General", "path": []},
+        "a": {"id": "a", "kind": "article", "number": "1", "title": "Scope", "path": ["c"]},
+        "p1": {"id": "p1", "kind": "paragraph", "path": ["c", "a"]},
+        "p2": {"id": "p2", "kind": "paragraph", "path": ["c", "a"]},
+    }
+    cache: dict = {}
+    expected = "Chapter I \u2014 General > Article 1 \u2014 Scope"
+    assert _build_context_prefix(by_id["p1"], by_id, cache) == expected
+    assert cache == {("c", "a"): expected}
+    assert _build_context_prefix(by_id["p2"], by_id, cache) == expected
+    assert _build_context_prefix(by_id["a"], by_id, cache) == _build_context_prefix(by_id["a"], by_id) == expected